@@ -19,11 +19,139 @@ Typical usage example:
     connector.close_telnet_connection('R1')
 """
 
+import asyncio
+import contextlib
+import logging
+import logging.handlers
 import os
-import telnetlib
+import re
+import select
+import selectors
+import socket
+import threading
 import time
 
 import gns3fy
+import requests
+
+# Buffered logger: debug records accumulate in memory and only hit the
+# stream in batches (or immediately on ERROR), keeping write syscalls off
+# the per-command hot path.
+logger = logging.getLogger("gns3conn")
+if not logger.handlers:
+	logger.addHandler(logging.handlers.MemoryHandler(
+		capacity=1024, flushLevel=logging.ERROR, target=logging.StreamHandler()))
+	logger.propagate = False
+
+
+class _RawTelnet:
+	"""
+	Minimal Telnet-like client over a plain TCP socket.
+
+	telnetlib funnels every received byte through its Python option-negotiation
+	state machine, which dominates the cost of draining large show outputs.
+	GNS3 console ports carry no meaningful Telnet negotiation, so this reader
+	does bulk recv() into a bytearray and scans it with C-level searches while
+	keeping the subset of the telnetlib.Telnet API the Connector uses.
+	"""
+
+	def __init__(self, host: str, port: int) -> None:
+		self.sock = socket.create_connection((host, port))
+		self.buf = bytearray()
+		self.search_from = 0
+		# Consoles are loopback-only: disabling delayed ACK shaves the other
+		# half of the Nagle interaction. Linux resets the flag after reads,
+		# so fill() re-arms it; on platforms without it this stays a no-op.
+		self._quickack = hasattr(socket, "TCP_QUICKACK")
+		if self._quickack:
+			self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+
+	def get_socket(self) -> socket.socket:
+		"""Returns the underlying socket."""
+		return self.sock
+
+	def write(self, data: bytes) -> None:
+		"""Sends raw bytes to the console."""
+		self.sock.sendall(data)
+
+	def fill(self, timeout: float) -> bool:
+		"""
+		Reads whatever the socket has available within the timeout into the buffer.
+
+		Returns:
+			bool: True if bytes were appended, False if the socket stayed silent.
+
+		Raises:
+			EOFError: If the remote side closed the connection.
+		"""
+		if not select.select([self.sock], [], [], timeout)[0]:
+			return False
+		chunk = self.sock.recv(65536)
+		if not chunk:
+			raise EOFError("Telnet connection closed by remote host.")
+		if self._quickack:
+			self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+		self.buf += chunk
+		return True
+
+	def _consume(self, end: int) -> bytes:
+		data = bytes(self.buf[:end])
+		del self.buf[:end]
+		self.search_from = 0
+		return data
+
+	def read_until(self, needle: bytes, timeout: float = None) -> bytes:
+		"""
+		Reads until the needle appears, or until the timeout elapses.
+
+		Like telnetlib, returns whatever was read so far on timeout.
+		"""
+		deadline = None if timeout is None else time.monotonic() + timeout
+		while True:
+			# Resume the scan where the last one stopped (minus a needle-sized
+			# overlap) instead of rescanning the whole buffer on each recv.
+			idx = self.buf.find(needle, max(0, self.search_from - len(needle) + 1))
+			if idx >= 0:
+				return self._consume(idx + len(needle))
+			self.search_from = len(self.buf)
+			remaining = 0.05 if deadline is None else deadline - time.monotonic()
+			if remaining <= 0:
+				return self._consume(len(self.buf))
+			self.fill(min(remaining, 0.05))
+
+	def expect(self, patterns: list, timeout: float = None) -> tuple:
+		"""
+		Reads until one of the compiled byte patterns matches.
+
+		Returns:
+			tuple: (pattern index, match object, bytes read), with index -1 and
+				no match when the timeout elapses first — same contract as
+				telnetlib.Telnet.expect().
+		"""
+		deadline = None if timeout is None else time.monotonic() + timeout
+		while True:
+			# 128 bytes of overlap is enough for any prompt pattern to match
+			# across a recv boundary without rescanning the whole buffer.
+			start = max(0, self.search_from - 128)
+			for index, pattern in enumerate(patterns):
+				match = pattern.search(self.buf, start)
+				if match:
+					return index, match, self._consume(match.end())
+			self.search_from = len(self.buf)
+			remaining = 0.05 if deadline is None else deadline - time.monotonic()
+			if remaining <= 0:
+				return -1, None, self._consume(len(self.buf))
+			self.fill(min(remaining, 0.05))
+
+	def read_very_eager(self) -> bytes:
+		"""Drains everything currently available without blocking."""
+		while self.fill(0):
+			pass
+		return self._consume(len(self.buf))
+
+	def close(self) -> None:
+		"""Closes the underlying socket."""
+		self.sock.close()
 
 
 class Connector:
@@ -32,7 +160,7 @@ class Connector:
 	via Telnet sessions.
 	"""
 
-	def __init__(self, project_name: str = None, server: str = "http://localhost:3080") -> None:
+	def __init__(self, project_name: str = None, server: str = "http://localhost:3080", verbose: bool = False) -> None:
 		"""
 		Initializes a connection to a GNS3 server and loads a project.
 
@@ -40,16 +168,70 @@ class Connector:
 			project_name (str): The name of the GNS3 project to load. If None, it selects the
 							first opened project automatically.
 			server (str): The GNS3 server URL (default: "http://localhost:3080").
+			verbose (bool): If True, print progress messages while connecting and
+							sending commands (default: False).
 		"""
+		self.verbose = verbose
+		if verbose:
+			logger.setLevel(logging.DEBUG)
 		self.server = gns3fy.Gns3Connector(server)
+		# gns3fy already keeps one requests.Session; widen its connection
+		# pool so concurrent API calls reuse keep-alive sockets instead of
+		# re-handshaking.
+		adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32,
+		                                        max_retries=requests.adapters.Retry(total=3, backoff_factor=0.2))
+		self.server.session.mount("http://", adapter)
+		self.server.session.mount("https://", adapter)
 		if project_name is None:
 			for project in self.server.get_projects():
 				if project["status"] == "opened":
 					project_name = project["name"]
 					break
 		self.project = gns3fy.Project(project_name, connector=self.server)
-		self.project.get()
+		self._project_loaded = False
+		self._refresh_deferred = False
+		self._refresh_pending = False
+		self._refresh_lock = threading.Lock()
 		self.telnet_session = {}
+		self._log_files = {}
+		self._patterns = {}
+		self._prompts = {}
+		self._strip_patterns = {}
+
+	def ensure_project_loaded(self) -> None:
+		"""
+		Fetches the project metadata from the GNS3 server on first use.
+
+		Deferring project.get() out of __init__ saves the HTTP round-trip for
+		scripts that never touch nodes or links; every lookup method calls this
+		before reading the cached tables. The flag is double-checked under the
+		refresh lock and only set once the lookup tables exist, so concurrent
+		callers sharing one connector never see a half-loaded project.
+		"""
+		if self._project_loaded:
+			return
+		with self._refresh_lock:
+			if self._project_loaded:
+				return
+			self.project.get()
+			self.invalidate_nodes_cache()
+			self._project_loaded = True
+
+	def invalidate_nodes_cache(self) -> None:
+		"""
+		Rebuilds the hostname, node-id and link lookup tables from the current project state.
+
+		Call this after nodes or links are added or removed outside the decorated
+		methods so that lookups stay in sync with the GNS3 project.
+		"""
+		self._nodes_by_name = {n.name: n for n in self.project.nodes}
+		self._node_by_id = {n.node_id: n for n in self.project.nodes}
+		self._link_index = {}
+		self._used_adapters = set()
+		for link in self.project.links:
+			adapters = {node["node_id"]: node["adapter_number"] for node in link.nodes}
+			self._link_index[frozenset(adapters)] = (link, adapters)
+			self._used_adapters.update(adapters.items())
 
 	def get_router_config_path(self, node_name: str) -> str:
 		"""
@@ -65,20 +247,21 @@ class Connector:
 			FileNotFoundError: If the configuration directory or file does not exist.
 			ValueError: If the specified node is not found in the project.
 		"""
-		node = next((n for n in self.project.nodes if n.name == node_name), None)
-		if node:
-			path = os.path.join(node.node_directory, "configs")
-			if not os.path.isdir(path):
-				raise FileNotFoundError(f"The configs directory does not exist at {path}")
+		node = self.get_node(node_name)
+		path = os.path.join(node.node_directory, "configs")
+		if not os.path.isdir(path):
+			raise FileNotFoundError(f"The configs directory does not exist at {path}")
 
-			for root, _, files in os.walk(path):
-				for file in files:
-					if "startup-config.cfg" in file:
-						return os.path.join(root, file)
+		direct = os.path.join(path, "startup-config.cfg")
+		if os.path.isfile(direct):
+			return direct
 
-			raise FileNotFoundError(f"No startup-config file found in {path}")
-		else:
-			raise ValueError(f"Node {node_name} not found in the project.")
+		with os.scandir(path) as entries:
+			for entry in entries:
+				if entry.is_file() and "startup-config.cfg" in entry.name:
+					return entry.path
+
+		raise FileNotFoundError(f"No startup-config file found in {path}")
 
 	def telnet_connection(self, node_name: str) -> None:
 		"""
@@ -92,55 +275,85 @@ class Connector:
 			ConnectionError: If the connection fails.
 			TimeoutError: If the router does not become ready within the expected time.
 		"""
-		node = next((n for n in self.project.nodes if n.name == node_name), None)
-
-		if node:
-			if node.console_type != "telnet":
-				raise ValueError(f"Node {node_name} does not support Telnet.")
+		node = self.get_node(node_name)
+		if node.console_type != "telnet":
+			raise ValueError(f"Node {node_name} does not support Telnet.")
 
-			host = "localhost"
-			port = node.console
+		host = "localhost"
+		port = node.console
 
-			print(f"Connecting to {node_name} on {host}:{port} via Telnet...")
+		logger.debug("Connecting to %s on %s:%s via Telnet...", node_name, host, port)
 
+		try:
+			session = _RawTelnet(host, port)
+			# Nagle would hold back the one-byte writes (\r\n pokes,
+			# --More-- spaces) for up to one ACK round-trip each.
+			sock = session.get_socket()
+			sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+			sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+			# Let bulk show output accumulate kernel-side between reads.
+			sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+			sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 18)
+			self.telnet_session[node_name] = session
+
+			logger.debug("Telnet connection established. Waiting for router to be ready...")
+
+			prompt = self.get_prompt(node_name)
+			timeout = 90
+			buf = bytearray()
+			sel = selectors.DefaultSelector()
+			sel.register(session.get_socket(), selectors.EVENT_READ)
 			try:
-				self.telnet_session[node_name] = telnetlib.Telnet(host, port)
-				node_name = node_name
-
-				print("Telnet connection established. Waiting for router to be ready...")
-
-				max_attempts = 30
-				attempt = 0
-				while attempt < max_attempts:
-					try:
-						self.telnet_session[node_name].write(b"\r\n")
-						output = self.telnet_session[node_name].read_very_eager().decode('ascii')
-						if f"{node_name}#" in output:
-							print(f"Router {node_name} is ready.")
-							self.telnet_session[node_name].write(b"\r\n")
-							time.sleep(1)
-							self.telnet_session[node_name].read_until(f"{node_name}#".encode('ascii'))
+				deadline = time.monotonic() + timeout
+				last_poke = 0.0
+				while time.monotonic() < deadline:
+					now = time.monotonic()
+					if now - last_poke >= 0.5:
+						session.write(b"\r\n")
+						last_poke = now
+					if sel.select(timeout=0.05):
+						buf += session.read_very_eager()
+						if prompt in buf:
+							logger.debug("Router %s is ready.", node_name)
+							session.write(b"\r\n")
+							session.read_until(prompt, timeout=1)
 							return
-					except Exception as e:
-						pass
-					time.sleep(3)
-					attempt += 1
-				raise TimeoutError(f"Router {node_name} did not become ready within {max_attempts * 3} seconds.")
+				raise TimeoutError(f"Router {node_name} did not become ready within {timeout} seconds.")
+			finally:
+				sel.close()
 
-			except Exception as e:
-				self.telnet_session[node_name] = None
-				node_name = None
-				raise ConnectionError(f"Failed to connect to {node_name}: {e}")
-		else:
-			raise ValueError(f"Node {node_name} not found in the project.")
+		except Exception as e:
+			self.telnet_session[node_name] = None
+			raise ConnectionError(f"Failed to connect to {node_name}: {e}")
 
-	def send_commands_to_node(self, commands: list, node_name) -> None:
+	def get_log_file(self, node_name: str):
+		"""
+		Returns the persistent command log handle for a node, opening it on first use.
+
+		The handle is opened in binary append mode with a 64 KiB buffer so that
+		per-command writes do not each pay an open/close plus a syscall.
+
+		Args:
+			node_name (str): Name of the router/node.
+
+		Returns:
+			The buffered binary file object for the node's command log.
+		"""
+		log_file = self._log_files.get(node_name)
+		if log_file is None:
+			log_file = open(f"command_output_{node_name}.log", "ab", buffering=1 << 16)
+			self._log_files[node_name] = log_file
+		return log_file
+
+	def send_commands_to_node(self, commands: list, node_name, decode: bool = False) -> None:
 		"""
 		Sends a list of commands to a router via an active Telnet connection.
 
 		Args:
 			commands (list): List of commands to send to the router.
 			node_name (str): Name of the router/node.
+			decode (bool): If True, decode each output and strip the prompts
+				before logging; by default the raw bytes are logged as-is.
 
 		Raises:
 			RuntimeError: If there is no active Telnet connection or if the
@@ -149,39 +362,215 @@ class Connector:
 		if self.telnet_session.get(node_name, None) is None:
 			raise RuntimeError("No active Telnet connection. Please establish a connection using telnet_connection().")
 
-		log_path = f"command_output_{node_name}.log"
 		try:
-			with open(log_path, "w") as log_file:
-				for command in commands:
-					print(f"Sending command: {command}")
-					output = self.get_output(command, node_name)
-
-					decoded_output = output.decode('ascii').replace(f"{node_name}#", "").replace(f"{node_name}(config)#", "").replace(f"{node_name}(config-rtr)#", "").replace(f"{node_name}(config-router)#", "").replace(f"{node_name}(config-router-af)#", "").replace(f"{node_name}(config-route-map)#", "").replace(f"{node_name}(config-if)#", "").replace(command, "").strip()
-					log_file.write(f"Command: {command}\n{decoded_output}\n\n")
-			self.clean_log(log_path, log_path)
+			log_file = self.get_log_file(node_name)
+			session = self.telnet_session[node_name]
+			patterns = self.get_patterns(node_name)
+			logger.debug("Sending %d commands to %s", len(commands), node_name)
+			encoded = [command.encode('ascii') for command in commands]
+			# One sendall for the whole batch: the console accepts pipelined
+			# input, so we pay one syscall and one round-trip instead of one
+			# per command, then count prompts to delimit each output.
+			session.write(b"\r\n".join(encoded) + b"\r\n")
+			outputs = []
+			current = bytearray()
+			while len(outputs) < len(commands):
+				index, _, chunk = session.expect(patterns, timeout=2.0)
+				current.extend(chunk)
+				if index == 0:
+					session.write(b" ")
+				else:
+					outputs.append(bytes(current))
+					current.clear()
+					if index == -1 and not chunk:
+						break
+			for command, cmd_bytes, output in zip(commands, encoded, outputs):
+				if decode:
+					decoded_output = self.get_strip_pattern(node_name).sub("", output.decode('ascii')).replace(command, "").strip()
+					# Filter the pager markers and blank lines while writing,
+					# instead of re-reading the whole log with clean_log after.
+					cleaned = "\n".join(line for line in map(str.rstrip, decoded_output.splitlines())
+					                    if line and "--More--" not in line)
+					log_file.write(f"Command: {command}\n{cleaned}\n\n".encode('ascii'))
+				else:
+					log_file.write(b"Command: " + cmd_bytes + b"\n" + output + b"\n\n")
+			log_file.flush()
 		except Exception as e:
 			raise RuntimeError(f"Failed to send commands to {node_name}: {e}")
 
-	def get_output(self, command, node_name):
+	def get_prompt(self, node_name: str) -> bytes:
+		"""
+		Returns the exec-prompt bytes for a node, encoded once and cached.
+
+		Args:
+			node_name (str): Name of the router/node.
+
+		Returns:
+			bytes: The node's exec prompt, e.g. b"R1#".
+		"""
+		prompt = self._prompts.get(node_name)
+		if prompt is None:
+			prompt = f"{node_name}#".encode('ascii')
+			self._prompts[node_name] = prompt
+		return prompt
+
+	def get_strip_pattern(self, node_name: str) -> "re.Pattern":
+		"""
+		Returns the compiled pattern matching any prompt variant of a node.
+
+		One substitution with this pattern replaces the chain of str.replace
+		calls over every exec and config-mode prompt, so a large decoded
+		output is scanned once instead of seven times.
+
+		Args:
+			node_name (str): Name of the router/node.
+
+		Returns:
+			re.Pattern: Pattern matching e.g. "R1#" or "R1(config-if)#".
+		"""
+		pattern = self._strip_patterns.get(node_name)
+		if pattern is None:
+			pattern = re.compile(re.escape(node_name) + r"(?:\(config[^)]*\))?#")
+			self._strip_patterns[node_name] = pattern
+		return pattern
+
+	def get_patterns(self, node_name: str) -> list:
+		"""
+		Returns the compiled read patterns for a node, building them on first use.
+
+		The list holds the --More-- pager marker first and the node prompt
+		(including config sub-modes) second, so the same compiled regexes are
+		reused for every command sent to that node.
+
+		Args:
+			node_name (str): Name of the router/node.
+
+		Returns:
+			list: Compiled byte patterns usable with Telnet.expect().
+		"""
+		patterns = self._patterns.get(node_name)
+		if patterns is None:
+			patterns = [re.compile(rb"--More--"), re.compile(re.escape(node_name).encode('ascii') + rb"(?:\([^)]*\))?#")]
+			self._patterns[node_name] = patterns
+		return patterns
+
+	def get_output(self, command, node_name, max_wait: float = 2.0):
 		"""
 		Retrieves the output of a command sent to a router via Telnet.
 
 		Args:
 			command (str): The command to send to the router.
 			node_name (str): Name of the router/node.
+			max_wait (float): Ceiling in seconds to wait for each read; the
+				read returns as soon as the prompt matches, so a generous
+				ceiling only costs time when a page really is slow (default: 2).
 
 		Returns:
 			bytes: The raw output from the router in bytes format.
 		"""
-		self.telnet_session[node_name].write(command.encode('ascii') + b"\r\n")
-		output = b""
-		chunk = self.telnet_session[node_name].read_until(f"#".encode('ascii'), timeout=2)
-		output += chunk
-		while b"--More--" in chunk:
-			self.telnet_session[node_name].write(b" ")
-			chunk = self.telnet_session[node_name].read_until(b"--More--", timeout=2)
-			output += chunk
-		return output
+		session = self.telnet_session[node_name]
+		patterns = self.get_patterns(node_name)
+		cmd_bytes = command.encode('ascii')
+		session.write(cmd_bytes + b"\r\n")
+		output = bytearray()
+		index, _, chunk = session.expect(patterns, timeout=max_wait)
+		output.extend(chunk)
+		while index == 0:
+			session.write(b" ")
+			index, _, chunk = session.expect(patterns, timeout=max_wait)
+			output.extend(chunk)
+		return bytes(output)
+
+	async def _read_until_prompt(self, reader: "asyncio.StreamReader", prompt_pattern: "re.Pattern", node_name: str, timeout: float = 10.0) -> None:
+		"""
+		Reads from an async console stream until a prompt variant appears.
+
+		readuntil() only knows a fixed separator, which cannot follow the
+		prompt through config sub-modes (R1# becomes R1(config)# and so on),
+		so this accumulates chunks and matches the compiled prompt pattern.
+		Each read is bounded by a timeout so a prompt that never shows up
+		raises instead of hanging the whole push.
+
+		Args:
+			reader (asyncio.StreamReader): Stream to read the console from.
+			prompt_pattern (re.Pattern): Compiled bytes pattern of the prompt.
+			node_name (str): Name of the router/node, for error messages.
+			timeout (float): Ceiling in seconds for each read (default: 10).
+
+		Raises:
+			TimeoutError: If no data arrives before the timeout.
+			ConnectionError: If the console closes before the prompt appears.
+		"""
+		buffer = b""
+		while True:
+			chunk = await asyncio.wait_for(reader.read(4096), timeout)
+			if not chunk:
+				raise ConnectionError(f"Console of {node_name} closed before the prompt appeared")
+			buffer += chunk
+			if prompt_pattern.search(buffer):
+				return
+			# 128 bytes of overlap is enough for any prompt pattern to match
+			buffer = buffer[-128:]
+
+	async def _push_one(self, node_name: str, commands: list) -> None:
+		"""
+		Opens a console connection to one node and sends it a list of commands.
+
+		Each task owns its own reader/writer pair, so several routers can be
+		configured concurrently without sharing Telnet state.
+
+		Args:
+			node_name (str): Name of the router/node.
+			commands (list): List of commands to send to the router.
+		"""
+		node = self.get_node(node_name)
+		# Same exec/config-mode prompt pattern as the sync path: after
+		# "configure terminal" the bare exec prompt never comes back.
+		prompt_pattern = self.get_patterns(node_name)[1]
+		reader, writer = await asyncio.open_connection("localhost", node.console)
+		sock = writer.get_extra_info("socket")
+		if sock is not None:
+			sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+		try:
+			writer.write(b"\r\n")
+			await writer.drain()
+			await self._read_until_prompt(reader, prompt_pattern, node_name)
+			for command in commands:
+				writer.write(command.encode('ascii') + b"\r\n")
+				await writer.drain()
+				await self._read_until_prompt(reader, prompt_pattern, node_name)
+		finally:
+			writer.close()
+			await writer.wait_closed()
+
+	async def push_config_all(self, configs: dict, max_concurrency: int = 64) -> None:
+		"""
+		Pushes command lists to several routers concurrently.
+
+		Total wall time is bounded by the slowest router instead of the sum of
+		all per-router latencies. A semaphore caps the number of simultaneous
+		console connections so very large topologies do not exhaust sockets.
+
+		Args:
+			configs (dict): Mapping of node names to the list of commands to send.
+			max_concurrency (int): Maximum number of concurrent console sessions.
+		"""
+		semaphore = asyncio.Semaphore(max_concurrency)
+
+		async def limited(node_name: str, commands: list) -> None:
+			async with semaphore:
+				await self._push_one(node_name, commands)
+
+		await asyncio.gather(*(limited(node_name, commands) for node_name, commands in configs.items()))
+
+	def push_configs(self, configs: dict) -> None:
+		"""
+		Synchronous wrapper around push_config_all for non-async callers.
+
+		Args:
+			configs (dict): Mapping of node names to the list of commands to send.
+		"""
+		asyncio.run(self.push_config_all(configs))
 
 	def close_telnet_connection(self, node_name: str) -> None:
 		"""
@@ -197,13 +586,13 @@ class Connector:
 			try:
 				self.telnet_session[node_name].write(b"\r\n")
 				self.telnet_session[node_name].close()
-				print(f"Telnet connection to {node_name} has been closed.")
+				logger.debug("Telnet connection to %s has been closed.", node_name)
 			except Exception as e:
-				print(f"Error closing Telnet connection: {e}")
+				logger.error("Error closing Telnet connection: %s", e)
 			finally:
 				self.telnet_session[node_name] = None
 		else:
-			print("No active Telnet connection to close.")
+			logger.debug("No active Telnet connection to close.")
 
 	def __del__(self):
 		"""
@@ -212,8 +601,10 @@ class Connector:
 		"""
 		for node_name, session in self.telnet_session.items():
 			if session:
-				print("Automatically closing Telnet connection...")
+				logger.debug("Automatically closing Telnet connection...")
 				self.close_telnet_connection(node_name)
+		for log_file in self._log_files.values():
+			log_file.close()
 
 	@staticmethod
 	def refresh_project(func):
@@ -229,11 +620,36 @@ class Connector:
 
 		def wrapper(self, *args, **kwargs):
 			result = func(self, *args, **kwargs)
-			self.project.get()
+			if self._refresh_deferred:
+				self._refresh_pending = True
+			else:
+				self.project.get()
+				self.invalidate_nodes_cache()
+				self._project_loaded = True
 			return result
 
 		return wrapper
 
+	@contextlib.contextmanager
+	def batch(self):
+		"""
+		Defers the per-mutation project refresh until the end of a block.
+
+		Every decorated mutation normally re-fetches the whole project over
+		HTTP; wrapping a bulk create/update sequence in `with connector.batch():`
+		coalesces those round-trips into a single refresh on exit.
+		"""
+		self._refresh_deferred = True
+		try:
+			yield self
+		finally:
+			self._refresh_deferred = False
+			if self._refresh_pending:
+				self._refresh_pending = False
+				self.project.get()
+				self.invalidate_nodes_cache()
+				self._project_loaded = True
+
 	def get_node(self, node_name: str) -> gns3fy.Node:
 		"""
 		Retrieves a node object from the current GNS3 project.
@@ -247,12 +663,36 @@ class Connector:
 		Raises:
 			ValueError: If the node does not exist in the project.
 		"""
-		node = next((n for n in self.project.nodes if n.name == node_name), None)
+		self.ensure_project_loaded()
+		node = self._nodes_by_name.get(node_name)
+		if node is None and self._refresh_pending:
+			# Flush the deferred refresh so nodes created inside batch() resolve.
+			# The lock keeps concurrent lookups from refreshing the project twice.
+			with self._refresh_lock:
+				if self._refresh_pending:
+					self._refresh_pending = False
+					self.project.get()
+					self.invalidate_nodes_cache()
+			node = self._nodes_by_name.get(node_name)
 		if node:
 			return node
 		else:
 			raise ValueError(f"Node {node_name} not found in the project.")
 
+	def list_nodes(self) -> dict:
+		"""
+		Returns the nodes of the project as a hostname-to-node mapping.
+
+		Served from the cached project state, so callers can compare many
+		nodes against their intent with a single GET instead of probing the
+		server once per node.
+
+		Returns:
+			dict: Mapping of node names to gns3fy.Node objects.
+		"""
+		self.ensure_project_loaded()
+		return dict(self._nodes_by_name)
+
 	@refresh_project
 	def create_node(self, node_name: str, template: str) -> None:
 		"""
@@ -262,6 +702,7 @@ class Connector:
 			node_name (str): Name of the new node.
 			template (str): Template for the node.
 		"""
+		self.ensure_project_loaded()
 		node = gns3fy.Node(
 			project_id=self.project.project_id,
 			connector=self.server,
@@ -286,22 +727,18 @@ class Connector:
 		"""
 		node_1 = self.get_node(r1)
 		node_2 = self.get_node(r2)
-		interface = None
-		for link in self.project.links:
-			found = 0
-			node_1_index = None
-			for (i, node) in enumerate(link.nodes):
-				if node["node_id"] == node_1.node_id:
-					node_1_index = i
-					found += 1
-				if node["node_id"] == node_2.node_id:
-					found += 1
-			if found == 2:
-				interface = link.nodes[node_1_index]["adapter_number"]
-		if interface == None:
-			raise KeyError(f"Link between {r1} and {r2} not found in the project.")
-		else:
-			return interface
+		key = frozenset((node_1.node_id, node_2.node_id))
+		entry = self._link_index.get(key)
+		if entry is None:
+			# The link may have been created outside the decorated methods;
+			# refresh the index once before giving up.
+			self.project.get()
+			self.invalidate_nodes_cache()
+			entry = self._link_index.get(key)
+			if entry is None:
+				raise KeyError(f"Link between {r1} and {r2} not found in the project.")
+		_, adapters = entry
+		return adapters[node_1.node_id]
 
 	@refresh_project
 	def create_link_if_it_doesnt_exist(self, r1: str, r2: str, interface_1: int, interface_2: int) -> None:
@@ -321,42 +758,21 @@ class Connector:
 		try:
 			node_1 = self.get_node(r1)
 			node_2 = self.get_node(r2)
-			interface_1_real = None
-			interface_2_real = None
-			already_found = False
-			for link in self.project.links:
-				found = 0
-				node_1_index = None
-				node_2_index = None
-				for (i, node) in enumerate(link.nodes):
-					if node["node_id"] == node_1.node_id:
-						node_1_index = i
-						found += 1
-					if node["node_id"] == node_2.node_id:
-						node_2_index = i
-						found += 1
-				if found == 2:
-					interface_1_real = link.nodes[node_1_index]["adapter_number"]
-					interface_2_real = link.nodes[node_2_index]["adapter_number"]
-					already_found = True
-			if interface_1_real == interface_1 or already_found:
-				if interface_2_real == interface_2 or already_found:
-					pass
-				else:
-					raise ValueError(f"Interface {interface_1} already in use")
-			else:
-				if interface_2_real == interface_2:
-					raise ValueError(f"Interface {interface_2} already in use")
-				else:
-					nodes = [
-						{"node_id": node_1.node_id, "adapter_number": interface_1, "port_number": 0},
-						{"node_id": node_2.node_id, "adapter_number": interface_2, "port_number": 0}
-					]
-					link = gns3fy.Link(project_id=self.project.project_id, connector=self.server, nodes=nodes)
-					link.create()
+			if frozenset((node_1.node_id, node_2.node_id)) in self._link_index:
+				return
+			if (node_1.node_id, interface_1) in self._used_adapters:
+				raise ValueError(f"Interface {interface_1} already in use")
+			if (node_2.node_id, interface_2) in self._used_adapters:
+				raise ValueError(f"Interface {interface_2} already in use")
+			nodes = [
+				{"node_id": node_1.node_id, "adapter_number": interface_1, "port_number": 0},
+				{"node_id": node_2.node_id, "adapter_number": interface_2, "port_number": 0}
+			]
+			link = gns3fy.Link(project_id=self.project.project_id, connector=self.server, nodes=nodes)
+			link.create()
 
 		except Exception as e:
-			print("Had an issue creating links : ", e)
+			logger.error("Had an issue creating links : %s", e)
 
 	@refresh_project
 	def update_node_position(self, node_name: str, x: int, y: int) -> None:
@@ -380,7 +796,7 @@ class Connector:
 	@refresh_project
 	def start_node(self, node_name: str) -> None:
 		"""
-		Stops and then starts the specified node (reboots it).
+		Starts the specified node, stopping it first only if it is already running.
 
 		Args:
 			node_name (str): Name of the node to start.
@@ -389,7 +805,9 @@ class Connector:
 			Exception: If the node cannot be stopped or started.
 		"""
 		node = self.get_node(node_name)
-		node.stop()
+		node.get()
+		if node.status == "started":
+			node.stop()
 		node.start()
 
 	@staticmethod
@@ -410,31 +828,78 @@ class Connector:
 			file contains neatly formatted command outputs.
 		"""
 		try:
-			with open(input_file, "r") as log_file:
-				lines = log_file.readlines()
-
-			cleaned_lines = []
-			for line in lines:
-				if "--More--" in line:
-					continue
-				stripped_line = line.rstrip()
-				if stripped_line:
-					if len(cleaned_lines) == 0:
-						cleaned_lines.append(stripped_line + "\n")
-					elif stripped_line.startswith("Command: "):
-						cleaned_lines.append("\n" + stripped_line + "\n")
-					else:
-						cleaned_lines.append(stripped_line)
-
-			with open(output_file, "w") as cleaned_log:
-				cleaned_log.write("\n".join(cleaned_lines))
-
-			print(f"Log successfully cleaned. Output saved to {output_file}.")
+			target = output_file
+			if os.path.abspath(input_file) == os.path.abspath(output_file):
+				# Stream through a temp file so we never hold the log in memory.
+				target = output_file + ".tmp"
+
+			with open(input_file, "r", buffering=1 << 20) as log_file, \
+					open(target, "w", buffering=1 << 20) as cleaned_log:
+				first = True
+				for line in log_file:
+					if "--More--" in line:
+						continue
+					stripped_line = line.rstrip()
+					if stripped_line:
+						if first:
+							cleaned_log.write(stripped_line + "\n")
+							first = False
+						elif stripped_line.startswith("Command: "):
+							cleaned_log.write("\n\n" + stripped_line + "\n")
+						else:
+							cleaned_log.write("\n" + stripped_line)
+
+			if target != output_file:
+				os.replace(target, output_file)
+
+			logger.debug("Log successfully cleaned. Output saved to %s.", output_file)
 
 		except FileNotFoundError as err:
-			print(f"Error: File not found - {err}")
+			logger.error("Error: File not found - %s", err)
 		except Exception as err:
-			print(f"An error occurred: {err}")
+			logger.error("An error occurred: %s", err)
+
+	def stream_command(self, command: str, node_name: str, sink, max_wait: float = 2.0) -> None:
+		"""
+		Sends a command and feeds its cleaned output to a sink chunk by chunk.
+
+		Each pager page is decoded, stripped of the prompt, the command echo
+		and the --More-- markers, then handed to the sink as it arrives, so the
+		full output is never held in memory and the network read overlaps with
+		whatever the sink does (typically a buffered file write).
+
+		Args:
+			command (str): Command to send to the router.
+			node_name (str): Name of the router/node.
+			sink: Callable receiving each decoded output chunk (e.g. file.write).
+			max_wait (float): Ceiling in seconds to wait for each page; the
+				read returns as soon as a prompt or pager marker matches
+				(default: 2).
+
+		Raises:
+			RuntimeError: If there is no active Telnet connection.
+		"""
+		session = self.telnet_session.get(node_name, None)
+		if session is None:
+			raise RuntimeError("No active Telnet connection. Please establish a connection using telnet_connection().")
+
+		patterns = self.get_patterns(node_name)
+		strip_pattern = self.get_strip_pattern(node_name)
+		session.write(command.encode('ascii') + b"\r\n")
+		first = True
+		index, _, chunk = session.expect(patterns, timeout=max_wait)
+		while True:
+			decoded = strip_pattern.sub("", chunk.decode('ascii')).replace("--More--", "")
+			if first:
+				decoded = decoded.replace(command, "", 1).lstrip()
+				first = False
+			if index != 0:
+				decoded = decoded.rstrip()
+			sink(decoded)
+			if index != 0:
+				break
+			session.write(b" ")
+			index, _, chunk = session.expect(patterns, timeout=max_wait)
 
 	def send_command_and_get_output(self, command: str, node_name: str) -> str:
 		"""
@@ -459,13 +924,7 @@ class Connector:
 
 			decoded_output = output.decode('ascii')
 			# Clean up the output by removing the command prompt and the command itself
-			cleaned_output = decoded_output.replace(f"{node_name}#", "")
-			cleaned_output = cleaned_output.replace(f"{node_name}(config)#", "")
-			cleaned_output = cleaned_output.replace(f"{node_name}(config-rtr)#", "")
-			cleaned_output = cleaned_output.replace(f"{node_name}(config-router)#", "")
-			cleaned_output = cleaned_output.replace(f"{node_name}(config-router-af)#", "")
-			cleaned_output = cleaned_output.replace(f"{node_name}(config-route-map)#", "")
-			cleaned_output = cleaned_output.replace(f"{node_name}(config-if)#", "")
+			cleaned_output = self.get_strip_pattern(node_name).sub("", decoded_output)
 			cleaned_output = cleaned_output.replace(command, "").strip()
 
 			return cleaned_output
@@ -476,6 +935,7 @@ class Connector:
 
 if __name__ == "__main__":
 	connector = Connector()
+	connector.ensure_project_loaded()
 	print(f"Project '{connector.project.name}' connection successful.")
 	print(f"Project '{connector.project.name}' has {len(connector.project.nodes)} nodes.")
 	print(f"connector.project.nodes: {connector.project.nodes}")
@@ -8,8 +8,13 @@ Functions:
 - main: Orchestrates the overall configuration process for the routers.
 """
 
+import hashlib
+import json
+import logging
+import os
+import pickle
 import sys
-import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import intent_parser as parser
 from router import Router
@@ -17,8 +22,144 @@ import writer
 from GNS3 import Connector
 from saveFile import write_string_to_file
 
+logger = logging.getLogger("gen_router_cfg")
 
-def apply_router_configuration(connector: Connector, router: Router, config_data: str | list, mode: str) -> None:
+CONFIG_CACHE_DIR = "cache"
+
+INTENT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "nas")
+
+_config_cache = {}
+
+
+def parse_intent_file_cached(file: str):
+	"""
+	Parses an intent file, reusing a pickled result from previous runs.
+
+	The cache entry is keyed on the file's path, mtime and size, so editing
+	the intent invalidates it while repeated runs on the same file skip the
+	JSON parse and the AS/Router object graph construction entirely.
+	"""
+	try:
+		st = os.stat(file)
+	except OSError:
+		return parser.parse_intent_file(file)
+	key = hashlib.blake2b(f"{os.path.abspath(file)}:{st.st_mtime_ns}:{st.st_size}".encode(),
+	                      digest_size=16).hexdigest()
+	path = os.path.join(INTENT_CACHE_DIR, f"intent-{key}.pkl")
+	try:
+		with open(path, "rb") as cache_file:
+			return pickle.load(cache_file)
+	except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+		pass
+	result = parser.parse_intent_file(file)
+	try:
+		os.makedirs(INTENT_CACHE_DIR, exist_ok=True)
+		with open(path + ".tmp", "wb") as cache_file:
+			pickle.dump(result, cache_file)
+		os.replace(path + ".tmp", path)
+	except OSError:
+		pass
+	return result
+
+
+def _cache_default(value):
+	"""Rend les sets sérialisables et déterministes pour la clé de cache."""
+	if isinstance(value, (set, frozenset)):
+		return sorted(value, key=str)
+	return str(value)
+
+
+def _normalize_for_key(value):
+	"""Stringifie récursivement les clés de dict pour la clé de cache.
+
+	json.dumps n'appelle jamais default= pour les clés : un dict indexé par
+	tuple (dico_VRF_name est indexé par (CE, PE)) lèverait TypeError. Les
+	valeurs non standard restent gérées par _cache_default au dump.
+	"""
+	if isinstance(value, dict):
+		return {str(k): _normalize_for_key(v) for k, v in value.items()}
+	if isinstance(value, (list, tuple)):
+		return [_normalize_for_key(v) for v in value]
+	if isinstance(value, (set, frozenset)):
+		return sorted((_normalize_for_key(v) for v in value), key=str)
+	return value
+
+
+def get_config_string_cached(as_object, router: Router, mode: str):
+	"""
+	Returns the final configuration for a router, reusing cached results.
+
+	The key is a digest of the full AS and router state plus the mode, so an
+	unchanged router skips the whole string-generation pass: first within the
+	current run (dict lookup), then across runs (cache/<key>.json on disk,
+	written atomically).
+	"""
+	state = {
+		# Le compteur global est exclu : son repr contient une adresse mémoire
+		# et il n'influence pas la configuration générée à ce stade.
+		"as": {attr: getattr(as_object, attr, None) for attr in type(as_object).__slots__
+		       if attr != "global_router_counter"},
+		"router": {attr: getattr(router, attr, None) for attr in type(router).__slots__},
+		"mode": mode,
+	}
+	key = hashlib.blake2b(json.dumps(_normalize_for_key(state), default=_cache_default, sort_keys=True).encode(),
+	                      digest_size=16).hexdigest()
+	config = _config_cache.get(key)
+	if config is not None:
+		return config
+
+	path = os.path.join(CONFIG_CACHE_DIR, f"{key}.json")
+	try:
+		with open(path) as cache_file:
+			config = json.load(cache_file)
+	except (OSError, ValueError):
+		config = writer.get_final_config_string(as_object, router, mode)
+		os.makedirs(CONFIG_CACHE_DIR, exist_ok=True)
+		with open(path + ".tmp", "w") as cache_file:
+			json.dump(config, cache_file)
+		os.replace(path + ".tmp", path)
+	_config_cache[key] = config
+	return config
+
+
+def _apply_cfg(connector: Connector, router: Router, config_data: str | list, pending_writes: list | None = None) -> None:
+	"""
+	Writes the configuration to the router's startup-config file, or queues it
+	in pending_writes when the caller batches the writes.
+	"""
+	if config_data is None:
+		print(f"No configuration for {router.hostname}, skipping write.")
+		return
+	try:
+		router_config_path = connector.get_router_config_path(router.hostname)
+		if pending_writes is not None:
+			pending_writes.append((router_config_path, config_data))
+		else:
+			write_string_to_file(router_config_path, config_data)
+			print(f"Configuration for {router.hostname} written to {router_config_path}.")
+	except (ValueError, FileNotFoundError) as e:
+		print(f"Error processing {router.hostname}: {e}")
+
+
+def _apply_telnet(connector: Connector, router: Router, config_data: str | list, pending_writes: list | None = None) -> None:
+	"""
+	Sends the configuration commands to the router over its Telnet console.
+	"""
+	# Dumping a full multi-KB config through print blocks the Telnet path on
+	# stdout; at the default INFO level this lazy debug call is a no-op.
+	logger.debug("config for %s:\n%s", router.hostname, config_data)
+	try:
+		connector.send_commands_to_node(config_data, router.hostname)
+		connector.close_telnet_connection(router.hostname)
+		print(f"Configuration for {router.hostname} applied via Telnet.")
+	except (RuntimeError, ConnectionError) as e:
+		print(f"Error applying configuration to {router.hostname}: {e}")
+
+
+APPLIERS = {"cfg": _apply_cfg, "telnet": _apply_telnet}
+
+
+def apply_router_configuration(connector: Connector, router: Router, config_data: str | list, mode: str, pending_writes: list | None = None) -> None:
 	"""
 		Applies the configuration data to a router based on the specified mode of operation.
 
@@ -27,37 +168,30 @@ def apply_router_configuration(connector: Connector, router: Router, config_data
 		- router (object): The router object containing hostname and related information.
 		- config_data (str): Configuration data to apply to the router.
 		- mode (str): Mode of applying configuration - either 'cfg' (file-based) or 'telnet'.
+		- pending_writes (list | None): In 'cfg' mode, when given, (path, data) pairs are
+		  collected here instead of being written immediately, so the caller can flush
+		  them all at once.
 
 		Raises:
 		- ValueError, FileNotFoundError: Errors during configuration in 'cfg' mode.
 		- RuntimeError, ConnectionError: Errors during Telnet communication in 'telnet' mode.
 		"""
-	if mode == 'cfg':
-		try:
-			router_config_path = connector.get_router_config_path(router.hostname)
-			write_string_to_file(router_config_path, config_data)
-			print(f"Configuration for {router.hostname} written to {router_config_path}.")
-		except (ValueError, FileNotFoundError) as e:
-			print(f"Error processing {router.hostname}: {e}")
-	elif mode == 'telnet':
-		print(config_data)
-		try:
-			connector.send_commands_to_node(config_data, router.hostname)
-			connector.close_telnet_connection(router.hostname)
-			print(f"Configuration for {router.hostname} applied via Telnet.")
-		except (RuntimeError, ConnectionError) as e:
-			print(f"Error applying configuration to {router.hostname}: {e}")
-	else:
+	applier = APPLIERS.get(mode)
+	if applier is None:
 		print(f"Invalid mode '{mode}' specified. Skipping configuration for {router.hostname}.")
+		return
+	applier(connector, router, config_data, pending_writes)
 
 
-def main(mode: str, file: str) -> None:
+def main(mode: str, file: str, use_async: bool = False) -> None:
 	"""
 	Orchestrates the overall router configuration process based on the provided mode.
 
 	Parameters:
 	- mode (str): The mode of configuration to apply - either 'cfg' (file-based) or 'telnet'.
 	- file (str): Path to the infrastructure intent file containing router configurations.
+	- use_async (bool): In 'telnet' mode, push all configurations through one
+	  asyncio event loop instead of a thread per session.
 
 	Steps performed:
 	1. Parses intent file to extract autonomous systems and router details.
@@ -68,21 +202,37 @@ def main(mode: str, file: str) -> None:
 	Raises:
 	- ValueError, FileNotFoundError: Errors during configuration generation or application.
 	"""
-	(les_as, les_routers) = parser.parse_intent_file(file)
+	(les_as, les_routers) = parse_intent_file_cached(file)
 
 	connector = Connector()
 
 	as_dico = parser.as_list_into_as_number_dictionary(les_as)
 	router_dico = parser.router_list_into_hostname_dictionary(les_routers)
 
-	for router in les_routers:
-		router.create_router_if_missing(connector)
-		router.update_router_position(connector)
+	existing_nodes = connector.list_nodes()
+
+	def setup_one(router: Router) -> None:
+		node = existing_nodes.get(router.hostname)
+		if node is None:
+			router.create_router_if_missing(connector)
+			router.update_router_position(connector)
+		elif node.x != router.position["x"] or node.y != router.position["y"]:
+			router.update_router_position(connector)
+
+	with connector.batch():
+		# Each router's create/position pair is independent HTTP I/O, so the
+		# calls overlap on the pooled session instead of running back to back.
+		# Routers already in place send no request at all.
+		with ThreadPoolExecutor(max_workers=8) as setup_pool:
+			list(setup_pool.map(setup_one, les_routers))
 
 	todo = list()
 	for router in les_routers:
 		router.cleanup_used_interfaces(as_dico, router_dico, connector)
 		router.set_reserved_interface_data(as_dico, router_dico, mode)
+		# Loopback data only touches the shared ID counter and this router's
+		# links, so it fuses here; iteration order keeps IDs identical.
+		router.set_loopback_configuration_data(as_dico, router_dico, mode)
 	for router in les_routers:
 		if not router.set_interface_configuration_data(as_dico, router_dico, mode):
 			todo.append(router)
@@ -90,40 +240,89 @@ def main(mode: str, file: str) -> None:
 		router = todo.pop(0)
 		if not router.set_interface_configuration_data(as_dico, router_dico, mode):
 			todo.append(router)
-	for router in les_routers:
-		router.set_loopback_configuration_data(as_dico, router_dico, mode)
-		router.create_missing_links(as_dico, router_dico, connector)
 
-	if mode == 'telnet':
-		threads = {router.hostname: threading.Thread() for router in les_routers}
-	config_data = {router.hostname: "" for router in les_routers}
-	for router in les_routers:
+	executor = ThreadPoolExecutor(max_workers=min(32, len(les_routers))) if mode == 'telnet' and not use_async else None
+	connection_futures = {}
+	# les_routers order is fixed, so configs live in a list parallel to it
+	# rather than a hostname dict rebuilt just to be read back once.
+	config_data: list[str | list | None] = [None] * len(les_routers)
+	for i, router in enumerate(les_routers):
+		router.create_missing_links(as_dico, router_dico, connector)
 		router.set_ldp_config_data(as_dico, mode)
 		router.set_vrf_config_data(as_dico, router_dico, mode)
 		router.set_all_interface_vrf_config(as_dico, router_dico, mode)
 		router.set_bgp_config_data(as_dico, router_dico, mode)
 
 		try:
-			config_data[router.hostname] = writer.get_final_config_string(as_dico[router.AS_number], router, mode)
+			config_data[i] = get_config_string_cached(as_dico[router.AS_number], router, mode)
 
 			if mode == 'telnet':
 				connector.start_node(router.hostname)
-				threads[router.hostname] = threading.Thread(
-					target=connector.telnet_connection,
-					args=(router.hostname,),
-					daemon=True
-				)
-				threads[router.hostname].start()
+				if executor is not None:
+					connection_futures[router.hostname] = executor.submit(connector.telnet_connection, router.hostname)
 
 		except (ValueError, FileNotFoundError) as e:
 			print(f"Error creating configuration for {router.hostname}: {e}")
-	for router in les_routers:
+
+	pending_writes = [] if mode == 'cfg' else None
+	# The mode is constant for the whole run, so the applier is resolved once
+	# instead of comparing the mode string for every router.
+	applier = APPLIERS[mode]
+
+	def apply_one(i: int, router: Router) -> None:
+		if config_data[i] is None:
+			# Config generation already failed and reported for this router;
+			# queuing None would only crash the flush later.
+			print(f"Skipping {router.hostname}: no configuration was generated.")
+			return
+		connection_future = connection_futures.get(router.hostname)
+		if connection_future is not None:
+			# A hung console session fails this router after 30s instead of
+			# blocking the apply phase forever.
+			connection_future.result(timeout=30)
+		applier(connector, router, config_data[i], pending_writes)
+
+	def flush_one(pending: tuple[str, str]) -> None:
+		path, data = pending
 		try:
-			if mode == 'telnet':
-				threads[router.hostname].join()
-			apply_router_configuration(connector, router, config_data[router.hostname], mode)
-		except (ValueError, FileNotFoundError) as e:
-			print(f"Error applying configuration for {router.hostname}: {e}")
+			write_string_to_file(path, data)
+			print(f"Configuration written to {path}.")
+		except (OSError, ValueError, TypeError, AttributeError) as e:
+			# Broad on purpose: one bad entry must not kill the whole batch
+			# flush, the remaining routers still get their files.
+			print(f"Error writing {path}: {e}")
+
+	if mode == 'telnet' and use_async:
+		# One event loop multiplexes every console session, so no interpreter
+		# threads are spawned no matter how many routers there are.
+		configs = {router.hostname: config_data[i] for i, router in enumerate(les_routers) if config_data[i]}
+		try:
+			connector.push_configs(configs)
+			print(f"Configurations for {len(configs)} routers applied via Telnet.")
+		except (OSError, RuntimeError, ConnectionError) as e:
+			print(f"Error applying configurations asynchronously: {e}")
+	elif executor is not None:
+		# The sessions are network-bound, so overlapping them bounds the
+		# apply phase by the slowest router instead of the sum of them all.
+		apply_futures = {executor.submit(apply_one, i, router): router for i, router in enumerate(les_routers)}
+		for future in as_completed(apply_futures):
+			try:
+				future.result()
+			except (ValueError, FileNotFoundError, RuntimeError, ConnectionError, TimeoutError) as e:
+				print(f"Error applying configuration for {apply_futures[future].hostname}: {e}")
+		executor.shutdown()
+	else:
+		for i, router in enumerate(les_routers):
+			try:
+				apply_one(i, router)
+			except (ValueError, FileNotFoundError) as e:
+				print(f"Error applying configuration for {router.hostname}: {e}")
+
+	if pending_writes:
+		# Flush the collected .cfg files in one batch so the writes overlap
+		# instead of paying an open/write/close round trip per router.
+		with ThreadPoolExecutor(max_workers=8) as write_pool:
+			list(write_pool.map(flush_one, pending_writes))
 
 
 if __name__ == "__main__":
@@ -134,11 +333,15 @@ if __name__ == "__main__":
 	Command-line arguments:
 	- Mode (str): `cfg` or `telnet`. Determines the type of configuration application.
 	- File (str): Path to the intent JSON file. Defaults to "format/full_infra.json".
+	- `--async` (flag): In telnet mode, push all configurations through one
+	  asyncio event loop instead of one thread per router.
 
-	Prompts the user for mode if not provided via arguments. Exits with error if an 
+	Prompts the user for mode if not provided via arguments. Exits with error if an
 	invalid mode is provided.
 	"""
-	args_cons = sys.argv
+	logging.basicConfig(level=logging.INFO)
+	use_async = "--async" in sys.argv
+	args_cons = [arg for arg in sys.argv if arg != "--async"]
 	if len(args_cons) == 2:
 		mode = str(args_cons[1])
 		file = "format/full_infra.json"
@@ -151,4 +354,4 @@ if __name__ == "__main__":
 	if mode not in ["cfg", "telnet"]:
 		print("Invalid mode specified. Please use 'cfg' or 'telnet'.")
 		exit(1)
-	main(mode, file)
+	main(mode, file, use_async)
@@ -2,8 +2,22 @@
 Module for defining and managing Autonomous Systems (AS) in network simulations.
 This module contains classes to handle router ID assignment and AS configuration.
 """
+import io
+import sys
+
 from network import SubNetwork
 
+# Local-preference value and route-map label for each neighbor relationship.
+_STATE_TABLE = {
+    "peer": (200, "Peer"),
+    "provider": (100, "Provider"),
+    "client": (300, "Client"),
+}
+
+# Templates parsed once at import; each neighbor costs one format_map call.
+_RMAP_IN = "route-map {name} permit 10\n set local-preference {lp}\n set community {asn}:1000\n!\n"
+_CLIST = "ip community-list standard AS{asn} permit {asn}:1000\n"
+
 
 class GlobalRouterIDCounter:
     """
@@ -17,7 +31,7 @@ class GlobalRouterIDCounter:
         Initialize a new router ID counter starting at 1.
         """
         self.number = 1
-        self.reserved_id = []
+        self.reserved_id = set()
 
     def get_next_router_id(self) -> int:
         """
@@ -26,12 +40,11 @@ class GlobalRouterIDCounter:
         Returns:
             int: A unique router ID that hasn't been used or reserved.
         """
-        temp = self.number
-        self.number += 1
-        for this_id in self.reserved_id:
-            if self.number == this_id:
-                self.number += 1
-        return temp
+        next_id = self.number
+        while next_id in self.reserved_id:
+            next_id += 1
+        self.number = next_id + 1
+        return next_id
 
     def reserve_id(self, this_id: int):
         """
@@ -40,7 +53,7 @@ class GlobalRouterIDCounter:
         Args:
             this_id (int): The router ID to reserve.
         """
-        self.reserved_id.append(this_id)
+        self.reserved_id.add(this_id)
 
 
 class AS:
@@ -50,6 +63,13 @@ class AS:
     An Autonomous System is a collection of connected routers that operate
     under a single administrative domain with defined routing policies.
     """
+    __slots__ = (
+        "subnet_counter", "reserved_ipv4address", "ip_version", "ipv6_prefix", "ipv4_prefix", "AS_number",
+        "routers", "internal_routing", "connected_AS", "full_community_lists", "global_route_map_out",
+        "community_data", "connected_AS_dict", "hashset_routers", "loopback_prefix", "community",
+        "global_router_counter", "LDP_activation", "provider_edges",
+    )
+
     def __init__(self, ipv6_prefix: SubNetwork | None, AS_number: int, routers: list["Router"], internal_routing: str, connected_AS: list[tuple[int, str, dict]], loopback_prefix: SubNetwork, counter:GlobalRouterIDCounter, ip_version: int = 6, ipv4_prefix: SubNetwork | None = None, LDP_activation = False):
         """
         Initialize a new Autonomous System.
@@ -68,7 +88,7 @@ class AS:
             LDP_activation (bool, optional): Whether Label Distribution Protocol is activated.
         """
         self.subnet_counter = 0
-        self.reserved_ipv4address = []
+        self.reserved_ipv4address = set()
         self.ip_version = ip_version # todo : replace name with ipv6
         self.ipv6_prefix = ipv6_prefix
         self.ipv4_prefix = ipv4_prefix
@@ -76,63 +96,147 @@ class AS:
         self.routers = routers
         self.internal_routing = internal_routing
         self.connected_AS = connected_AS
-        self.full_community_lists = "".join([f"ip community-list standard AS{as_num} permit {as_num}:1000\n" for (as_num, _, _) in connected_AS])
-        total_not_client = 0
-        self.global_route_map_out = "route-map General-OUT deny 10\n"
+        rm_parts = ["route-map General-OUT deny 10\n"]
+        cl_parts = []
+        self.community_data = {}
+        self.connected_AS_dict = {}
         for (as_num, state, list_of_transport) in connected_AS:
+            # Interned once, the parsed state compares by identity against the
+            # "peer"/"provider"/"client" literals downstream.
+            state = sys.intern(state)
+            self.connected_AS_dict[as_num] = (state, list_of_transport)
             if state != "client":
-                self.global_route_map_out += f" match community AS{as_num}\n"
-                total_not_client += 1
-        self.global_route_map_out += "!\n"
-        if total_not_client > 0:
-            self.global_route_map_out += "route-map General-OUT permit 20\n!\n"
+                rm_parts.append(f" match community AS{as_num}\n")
+            local_pref, label = _STATE_TABLE[state]
+            rm_name = f"{label}-AS{as_num}"
+            values = {"name": rm_name, "asn": as_num, "lp": local_pref}
+            community_list = _CLIST.format_map(values)
+            cl_parts.append(community_list)
+            self.community_data[as_num] = {
+                "route_map_in": _RMAP_IN.format_map(values),
+                "route_map_in_bgp_name": rm_name,
+                "community_list": community_list
+            }
+        self.full_community_lists = "".join(cl_parts)
+        if len(rm_parts) > 1:
+            rm_parts.append("!\nroute-map General-OUT permit 20\n!\n")
+            self.global_route_map_out = "".join(rm_parts)
         else:
             self.global_route_map_out = "route-map General-OUT permit 20\n!\n"
-        self.community_data = {}
-        for (as_num, state, list_of_transport) in connected_AS:
-            if state == "peer":
-                self.community_data[as_num] = {
-                    "route_map_in":f"route-map Peer-AS{as_num} permit 10\n set local-preference 200\n set community {as_num}:1000\n!\n",
-                    "route_map_in_bgp_name":f"Peer-AS{as_num}",
-                    "community_list":f"ip community-list standard AS{as_num} permit {as_num}:1000\n"
-                }
-            elif state == "provider":
-                self.community_data[as_num] = {
-                    "route_map_in":f"route-map Provider-AS{as_num} permit 10\n set local-preference 100\n set community {as_num}:1000\n!\n",
-                    "route_map_in_bgp_name":f"Provider-AS{as_num}",
-                    "community_list":f"ip community-list standard AS{as_num} permit {as_num}:1000\n"
-                }
-            else:
-                self.community_data[as_num] = {
-                    "route_map_in":f"route-map Client-AS{as_num} permit 10\n set local-preference 300\n set community {as_num}:1000\n!\n",
-                    "route_map_in_bgp_name":f"Client-AS{as_num}",
-                    "community_list":f"ip community-list standard AS{as_num} permit {as_num}:1000\n"
-                }
-        self.connected_AS_dict = {as_num:(state, list_of_transport) for (as_num, state, list_of_transport) in connected_AS}
         self.hashset_routers = set(routers)
         self.loopback_prefix = loopback_prefix
         self.community = f"{self.AS_number}:1000"
         self.global_router_counter = counter
         self.LDP_activation = LDP_activation
+        self.provider_edges = None
+
+    def add_router(self, new_router: str):
+        """
+        Add a router hostname to the AS, keeping the list and the set in sync.
+
+        The set answers the O(1) membership check; the list keeps the
+        declaration order used for iteration and output.
+
+        Args:
+            new_router (str): Hostname of the router to add.
+        """
+        if new_router in self.hashset_routers:
+            return
+        self.hashset_routers.add(new_router)
+        self.routers.append(new_router)
+
+    def remove_router(self, router: str):
+        """
+        Remove a router hostname from the AS, if present.
+
+        Args:
+            router (str): Hostname of the router to remove.
+        """
+        if router in self.hashset_routers:
+            self.hashset_routers.discard(router)
+            self.routers.remove(router)
+
+    def add_connected_AS(self, as_num: int, state: str, list_of_transport: dict):
+        """
+        Register a connected AS, keeping the list and the dict in sync.
+
+        The dict is the O(1) source of truth for lookups; the list keeps the
+        declaration order used by __str__ and the intent file.
+
+        Args:
+            as_num (int): Number of the connected AS.
+            state (str): Relationship with that AS (peer, provider or client).
+            list_of_transport (dict): Transport addresses for the connection.
+        """
+        if as_num not in self.connected_AS_dict:
+            self.connected_AS.append((as_num, state, list_of_transport))
+        self.connected_AS_dict[as_num] = (state, list_of_transport)
+
+    def remove_connected_AS(self, as_num: int):
+        """
+        Remove a connected AS by number, if present.
+
+        Args:
+            as_num (int): Number of the AS to disconnect.
+        """
+        if self.connected_AS_dict.pop(as_num, None) is not None:
+            self.connected_AS = [entry for entry in self.connected_AS if entry[0] != as_num]
+
+    def compute_provider_edges(self, autonomous_systems: dict[int, "AS"], all_routers: dict[str, "Router"]) -> set[str]:
+        """
+        Return the set of provider-edge router hostnames of this AS.
+
+        The set is computed once on first call (each is_provider_edge check
+        scans that router's links) and reused afterwards, so BGP config
+        generation does not rescan every router of the AS for every router
+        being configured.
+
+        Args:
+            autonomous_systems: Dictionary mapping AS numbers to AS objects.
+            all_routers: Dictionary mapping hostnames to Router objects.
+
+        Returns:
+            set[str]: Hostnames of the provider-edge routers of this AS.
+        """
+        if self.provider_edges is None:
+            self.provider_edges = {hostname for hostname in self.routers
+                                   if all_routers[hostname].is_provider_edge(autonomous_systems, all_routers)}
+        return self.provider_edges
     
+    def __repr__(self):
+        """
+        Return a short identifier for the AS.
+
+        Kept cheap on purpose: this is what tracebacks and container reprs
+        hit, so it must not stringify the whole router list.
+
+        Returns:
+            str: The AS number and its router count.
+        """
+        return f"AS(number={self.AS_number}, routers={len(self.routers)})"
+
     def __str__(self):
         """
         Return a string representation of the AS.
 
         Returns:
-            str: A string with the AS's details including prefix, number, routers,
-                routing protocol, and connected ASes.
+            str: A string with the AS's details including prefix, number, router
+                hostnames, routing protocol, and connected ASes.
         """
-        return f"prefix:{self.ipv6_prefix}\n as_number:{self.AS_number}\n routers:{self.routers}\n internal_routing:{self.internal_routing}\n connected_AS:{self.connected_AS}"
+        buf = io.StringIO()
+        buf.write(f"prefix:{self.ipv6_prefix}\n as_number:{self.AS_number}\n routers:")
+        buf.write(", ".join(self.routers))
+        buf.write(f"\n internal_routing:{self.internal_routing}\n connected_AS:{self.connected_AS}")
+        return buf.getvalue()
 
     def add_subnet_counter(self):
         """
         Increment the subnet counter and skip reserved addresses.
 
-        This method increases the subnet counter by 1 and checks if the new value
-        is in the reserved address list. If it is, it recursively calls itself
-        until finding a non-reserved address.
+        This method increases the subnet counter by 1 and keeps incrementing
+        while the value is in the reserved address set, so a long reserved
+        range is skipped without recursion.
         """
         self.subnet_counter += 1
-        if self.subnet_counter in self.reserved_ipv4address:
-            self.add_subnet_counter()
+        while self.subnet_counter in self.reserved_ipv4address:
+            self.subnet_counter += 1
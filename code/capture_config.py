@@ -8,7 +8,8 @@ pour analyse ultérieure.
 import os
 import sys
 import argparse
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, Tuple
 
 from GNS3 import Connector
 from intent_parser import parse_intent_file
@@ -31,29 +32,76 @@ def capture_router_config(connector: Connector, router_name: str, output_dir: st
         print(f"Connexion au routeur {router_name}...")
         connector.telnet_connection(router_name)
         
-        # Envoyer la commande "show running-config"
+        # Créer le répertoire de sortie s'il n'existe pas (exist_ok évite la
+        # course entre captures parallèles vers le même répertoire)
+        os.makedirs(output_dir, exist_ok=True)
+
+        # Créer le chemin du fichier de sortie
+        output_file = os.path.join(output_dir, f"{router_name}_config.txt")
+
+        # Envoyer la commande "show running-config" et écrire la sortie
+        # page par page : la config complète ne passe jamais en mémoire.
+        # Chaque page est encodée une fois et écrite en binaire, sans passer
+        # par l'encodeur incrémental de TextIOWrapper.
         print(f"Récupération de la configuration de {router_name}...")
-        output = connector.send_command_and_get_output("show running-config", router_name)
-        
+        with open(output_file, 'wb', buffering=65536) as f:
+            connector.stream_command("show running-config", router_name,
+                                     lambda page: f.write(page.encode('ascii', 'replace')))
+
         # Fermer la connexion telnet
         connector.close_telnet_connection(router_name)
-        
+
+        print(f"Configuration de {router_name} sauvegardée dans {output_file}")
+        return output_file
+    except Exception as e:
+        print(f"Erreur lors de la capture de la configuration de {router_name}: {e}")
+        return ""
+
+
+def capture_router_config_text(connector: Connector, router_name: str, output_dir: str = "configs") -> Tuple[str, str]:
+    """
+    Variante de capture_router_config qui renvoie aussi le texte capturé.
+
+    La configuration est écrite dans le même fichier que capture_router_config,
+    mais le texte est conservé en mémoire : l'appelant peut le parser
+    directement sans relire le fichier depuis le disque.
+
+    Args:
+        connector (Connector): Connecteur GNS3 pour communiquer avec les nœuds.
+        router_name (str): Nom du routeur dont on veut capturer la configuration.
+        output_dir (str): Répertoire de sortie pour les fichiers de configuration.
+
+    Returns:
+        Tuple[str, str]: Chemin du fichier créé et texte de la configuration.
+    """
+    try:
+        # Établir une connexion telnet avec le routeur
+        print(f"Connexion au routeur {router_name}...")
+        connector.telnet_connection(router_name)
+
         # Créer le répertoire de sortie s'il n'existe pas
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-            
+        os.makedirs(output_dir, exist_ok=True)
+
         # Créer le chemin du fichier de sortie
         output_file = os.path.join(output_dir, f"{router_name}_config.txt")
-        
-        # Écrire la configuration dans le fichier
-        with open(output_file, 'w') as f:
-            f.write(output)
-            
+
+        # Chaque page est écrite sur disque et gardée en mémoire
+        print(f"Récupération de la configuration de {router_name}...")
+        pages = []
+        with open(output_file, 'wb', buffering=65536) as f:
+            def sink(page: str):
+                pages.append(page)
+                f.write(page.encode('ascii', 'replace'))
+            connector.stream_command("show running-config", router_name, sink)
+
+        # Fermer la connexion telnet
+        connector.close_telnet_connection(router_name)
+
         print(f"Configuration de {router_name} sauvegardée dans {output_file}")
-        return output_file
+        return output_file, "".join(pages)
     except Exception as e:
         print(f"Erreur lors de la capture de la configuration de {router_name}: {e}")
-        return ""
+        return "", ""
 
 
 def capture_network_configs(intent_file: str, output_dir: str = "configs") -> Dict[str, str]:
@@ -69,17 +117,24 @@ def capture_network_configs(intent_file: str, output_dir: str = "configs") -> Di
     """
     # Charger le réseau
     _, routers = parse_intent_file(intent_file)
-    
-    # Créer un connecteur GNS3
-    connector = Connector()
-    
-    # Capturer les configurations de tous les routeurs
+
+    # Le répertoire commun est créé une fois ici plutôt qu'une fois par routeur
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Capturer les configurations en parallèle : chaque session telnet est
+    # indépendante et passe son temps à attendre le réseau. Chaque worker a
+    # son propre Connector pour ne pas partager les sessions telnet.
+    def capture_one(hostname: str) -> str:
+        return capture_router_config(Connector(), hostname, output_dir)
+
     config_files = {}
-    for router in routers:
-        config_file = capture_router_config(connector, router.hostname, output_dir)
-        if config_file:
-            config_files[router.hostname] = config_file
-    
+    with ThreadPoolExecutor(max_workers=min(32, len(routers) or 1)) as executor:
+        futures = {executor.submit(capture_one, router.hostname): router.hostname for router in routers}
+        for future in as_completed(futures):
+            config_file = future.result()
+            if config_file:
+                config_files[futures[future]] = config_file
+
     return config_files
 
 
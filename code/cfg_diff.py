@@ -7,20 +7,33 @@ un rapport détaillé des différences, facilitant ainsi l'analyse des changemen
 """
 
 import os
+import stat
 import sys
 import argparse
 from typing import Dict, List, Optional
 
-from GNS3 import Connector
-from capture_config import capture_router_config
-from compare_router_configs import compare_router_config_files, compare_running_configs
-from config_diff_report import generate_config_diff_report
-import os
+# Les modules lourds (GNS3, comparaison, rapport) sont importés dans les
+# branches de commande qui en ont besoin : `capture` ne paie pas l'import
+# des modules de comparaison et inversement.
+
+
+_file_exists_cache: Dict[str, bool] = {}
 
 
 def file_exists(filepath: str) -> bool:
-    """Vérifie si un fichier existe."""
-    return os.path.isfile(filepath)
+    """Vérifie si un fichier existe, en mémorisant le résultat par chemin.
+
+    Un seul appel à os.stat par chemin : les vérifications répétées du même
+    fichier (capture puis comparaison) ne refont pas de syscall.
+    """
+    cached = _file_exists_cache.get(filepath)
+    if cached is None:
+        try:
+            cached = stat.S_ISREG(os.stat(filepath).st_mode)
+        except OSError:
+            cached = False
+        _file_exists_cache[filepath] = cached
+    return cached
 
 
 def main():
@@ -54,10 +67,17 @@ def main():
     capture_parser.add_argument("--output", "-o", default="configs", help="Répertoire de sortie pour les fichiers de configuration")
     
     args = parser.parse_args()
-    
+
+    if args.command:
+        # Créé une fois ici avec exist_ok plutôt que testé puis créé en aval
+        os.makedirs(args.output, exist_ok=True)
+
     if args.command == "files":
+        from compare_router_configs import compare_router_config_files
+        from config_diff_report import generate_config_diff_report
+
         print(f"Comparaison des configurations {args.reference} et {args.new}...")
-        
+
         if not file_exists(args.reference):
             print(f"Erreur : Le fichier de référence '{args.reference}' est introuvable.")
             sys.exit(1)
@@ -79,6 +99,11 @@ def main():
             print(f"Sections modifiées: {len(diff['modified_sections'])}")
     
     elif args.command == "running":
+        from GNS3 import Connector
+        from capture_config import capture_router_config
+        from compare_router_configs import compare_router_config_files
+        from config_diff_report import generate_config_diff_report
+
         print(f"Comparaison des configurations en cours d'exécution de {args.reference} et {args.new}...")
         connector = Connector()
         
@@ -105,6 +130,9 @@ def main():
             print(f"Sections modifiées: {len(diff['modified_sections'])}")
     
     elif args.command == "capture":
+        from GNS3 import Connector
+        from capture_config import capture_router_config
+
         print(f"Capture de la configuration du routeur {args.router}...")
         connector = Connector()
         try:
@@ -8,30 +8,47 @@ implémenter ces différences.
 import os
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Tuple, Set
 
 from GNS3 import Connector
 from intent_parser import parse_intent_file
 from writer import get_all_telnet_commands
-from capture_config import capture_router_config
+from capture_config import capture_router_config_text
 from config_diff import compare_configs, parse_config, generate_commands_from_diff
 
 
-def generate_diff_from_intent_files(reference_file: str, new_file: str, output_dir: str = "diffs") -> Dict[str, List[str]]:
+# Commandes de référence mémorisées par (numéro d'AS, hostname) : le frozenset
+# pré-haché sert directement d'opérande aux différences d'ensembles, et les
+# appels répétés (mode batch) ne régénèrent pas les commandes.
+_reference_commands_cache: Dict[Tuple[int, str], Tuple[List[str], frozenset]] = {}
+
+
+def _reference_commands(as_obj, router) -> Tuple[List[str], frozenset]:
+    """Renvoie (liste, frozenset) des commandes telnet de référence d'un routeur."""
+    key = (router.AS_number, router.hostname)
+    cached = _reference_commands_cache.get(key)
+    if cached is None:
+        commands = get_all_telnet_commands(as_obj, router)
+        cached = (commands, frozenset(commands))
+        _reference_commands_cache[key] = cached
+    return cached
+
+
+def generate_diff_from_intent_files(reference_file: str, new_file: str, output_dir: str = "diffs") -> Dict[str, Set[str]]:
     """
     Génère les différences entre deux réseaux à partir des fichiers d'intention.
-    
+
     Args:
         reference_file (str): Chemin vers le fichier d'intention du réseau de référence.
         new_file (str): Chemin vers le fichier d'intention du réseau avec les nouveaux protocoles.
         output_dir (str): Répertoire de sortie pour les fichiers de diff.
-        
+
     Returns:
-        Dict[str, List[str]]: Dictionnaire des commandes à exécuter par hostname.
+        Dict[str, Set[str]]: Dictionnaire des commandes à exécuter par hostname.
     """
-    # Créer le répertoire de sortie s'il n'existe pas
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    # Créer le répertoire de sortie s'il n'existe pas (un seul appel idempotent)
+    os.makedirs(output_dir, exist_ok=True)
     
     # Charger les réseaux
     reference_as, reference_routers = parse_intent_file(reference_file)
@@ -45,39 +62,56 @@ def generate_diff_from_intent_files(reference_file: str, new_file: str, output_d
     reference_as_dict = {as_obj.AS_number: as_obj for as_obj in reference_as}
     new_as_dict = {as_obj.AS_number: as_obj for as_obj in new_as}
     
-    # Dictionnaire pour stocker les commandes par hostname
-    commands_by_hostname = {}
-    
-    # Pour chaque routeur dans le nouveau réseau
-    for hostname, new_router in new_routers_dict.items():
-        # Vérifier si le routeur existe dans le réseau de référence
-        if hostname in reference_routers_dict:
-            reference_router = reference_routers_dict[hostname]
-            
-            # Générer les commandes telnet pour les deux routeurs
-            reference_commands = get_all_telnet_commands(reference_as_dict[reference_router.AS_number], reference_router)
-            new_commands = get_all_telnet_commands(new_as_dict[new_router.AS_number], new_router)
-            
-            # Comparer les commandes
-            reference_commands_set = set(reference_commands)
+    def diff_one(hostname: str, new_router) -> Tuple[str, Set[str]]:
+        """Calcule et écrit le diff d'un routeur ; renvoie (hostname, commandes ajoutées)."""
+        reference_router = reference_routers_dict[hostname]
+
+        # Générer les commandes telnet pour les deux routeurs
+        reference_commands, reference_set = _reference_commands(reference_as_dict[reference_router.AS_number], reference_router)
+        new_commands = get_all_telnet_commands(new_as_dict[new_router.AS_number], new_router)
+
+        # Cas fréquents réglés avant de construire le moindre set :
+        # routeur inchangé -> rien à faire, référence vide -> tout est ajouté
+        if reference_commands == new_commands:
+            return hostname, set()
+        # Le résultat reste un set (tri uniquement à l'écriture) : pas de
+        # liste intermédiaire, et l'appelant garde l'appartenance en O(1)
+        if not reference_set:
+            added_commands = set(new_commands)
+        else:
+            # Trouver les commandes ajoutées ; si rien n'est partagé, la
+            # différence ne serait qu'une copie du set
             new_commands_set = set(new_commands)
-            
-            # Trouver les commandes ajoutées
-            added_commands = list(new_commands_set - reference_commands_set)
-            
-            # Si des commandes ont été ajoutées, les enregistrer
-            if added_commands:
-                commands_by_hostname[hostname] = added_commands
-                
-                # Écrire les commandes ajoutées dans un fichier
-                output_file = os.path.join(output_dir, f"{hostname}_diff.txt")
-                with open(output_file, 'w') as f:
-                    f.write(f"# Commandes ajoutées pour {hostname}\n")
-                    for cmd in sorted(added_commands):
-                        f.write(f"{cmd}\n")
-                
-                print(f"Diff pour {hostname} écrit dans {output_file}")
-    
+            if new_commands_set.isdisjoint(reference_set):
+                added_commands = new_commands_set
+            else:
+                added_commands = new_commands_set.difference(reference_set)
+
+        # Si des commandes ont été ajoutées, les écrire dans un fichier
+        if added_commands:
+            output_file = os.path.join(output_dir, f"{hostname}_diff.txt")
+            with open(output_file, 'w') as f:
+                # join assemble les lignes en C et produit une seule écriture
+                f.write(f"# Commandes ajoutées pour {hostname}\n"
+                        + "\n".join(sorted(added_commands)) + "\n")
+
+            print(f"Diff pour {hostname} écrit dans {output_file}")
+
+        return hostname, added_commands
+
+    # Chaque routeur est indépendant (fichier de sortie distinct, pas d'état
+    # partagé hors du cache de référence) : les diffs partent en parallèle
+    commands_by_hostname = {}
+    candidates = [(hostname, new_router) for hostname, new_router in new_routers_dict.items()
+                  if hostname in reference_routers_dict]
+    if candidates:
+        with ThreadPoolExecutor(max_workers=min(32, len(candidates))) as executor:
+            futures = [executor.submit(diff_one, hostname, new_router) for hostname, new_router in candidates]
+            for future in as_completed(futures):
+                hostname, added_commands = future.result()
+                if added_commands:
+                    commands_by_hostname[hostname] = added_commands
+
     return commands_by_hostname
 
 
@@ -94,21 +128,14 @@ def generate_diff_from_running_configs(reference_router: str, new_router: str, c
     Returns:
         List[str]: Liste de commandes telnet à exécuter pour appliquer les différences.
     """
-    # Créer le répertoire de sortie s'il n'existe pas
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-    
-    # Capturer les configurations des routeurs
-    reference_config_file = capture_router_config(connector, reference_router, "configs")
-    new_config_file = capture_router_config(connector, new_router, "configs")
-    
-    # Lire les configurations
-    with open(reference_config_file, 'r') as f:
-        reference_config = f.read()
-    
-    with open(new_config_file, 'r') as f:
-        new_config = f.read()
+    # Créer le répertoire de sortie s'il n'existe pas (un seul appel idempotent)
+    os.makedirs(output_dir, exist_ok=True)
     
+    # Capturer les configurations des routeurs : le texte revient directement
+    # en mémoire, pas besoin de relire les fichiers tout juste écrits
+    _, reference_config = capture_router_config_text(connector, reference_router, "configs")
+    _, new_config = capture_router_config_text(connector, new_router, "configs")
+
     # Parser les configurations
     parsed_reference = parse_config(reference_config)
     parsed_new = parse_config(new_config)
@@ -122,9 +149,8 @@ def generate_diff_from_running_configs(reference_router: str, new_router: str, c
     # Écrire les commandes dans un fichier
     output_file = os.path.join(output_dir, f"{reference_router}_to_{new_router}_diff.txt")
     with open(output_file, 'w') as f:
-        f.write(f"# Commandes pour transformer {reference_router} en {new_router}\n")
-        for cmd in commands:
-            f.write(f"{cmd}\n")
+        f.write(f"# Commandes pour transformer {reference_router} en {new_router}\n"
+                + "\n".join(commands) + "\n")
     
     print(f"Diff écrit dans {output_file}")
     
@@ -194,8 +220,15 @@ def main():
         
         if args.apply:
             print("\nApplication des différences aux routeurs...")
-            for hostname, commands in commands_by_hostname.items():
-                apply_diff_to_router(hostname, commands, connector)
+            # Chaque application est une session telnet indépendante qui passe
+            # son temps à attendre le routeur : on les lance en parallèle pour
+            # que le temps total tende vers le max et non la somme
+            if commands_by_hostname:
+                with ThreadPoolExecutor(max_workers=min(32, len(commands_by_hostname))) as executor:
+                    futures = [executor.submit(apply_diff_to_router, hostname, sorted(commands), connector)
+                               for hostname, commands in commands_by_hostname.items()]
+                    for future in as_completed(futures):
+                        future.result()
     
     elif args.command == "running":
         print(f"Comparaison des routeurs {args.reference} et {args.new}...")
@@ -4,14 +4,36 @@ Ce module permet de comparer deux fichiers de configuration de routeurs (.cfg) a
 les différences et générer un rapport détaillé, facilitant ainsi l'implémentation de nouveaux protocoles.
 """
 
+import functools
+import io
 import os
 import re
+import sys
 from typing import Dict, List, Tuple, Set, Optional
 
 from GNS3 import Connector
 from capture_config import capture_router_config
 
 
+# Alternation unique compilée une fois à l'import : un seul match par ligne
+# décide de la section (le groupe nommé qui a capturé dit laquelle), au lieu
+# de cinq regex recompilées et relancées à chaque appel de parse_config
+SECTION_RE = re.compile(
+    r'^(?:interface (?P<iface>\S+)'
+    r'|ipv6 router (?P<v6proto>\S+) (?P<v6pid>\S+)'
+    r'|router (?P<rproto>\S+) (?P<rpid>\S+)'
+    r'|route-map (?P<rmap>\S+)'
+    r'|ip access-list (?P<aclt>\S+) (?P<acln>\S+))'
+)
+
+# Compilée une fois ; la directive hostname est toujours en tête de config,
+# inutile de balayer tout le fichier pour la trouver
+HOSTNAME_RE = re.compile(r'^hostname (\S+)', re.MULTILINE)
+
+# Fenêtre de recherche du hostname (largement au-delà de l'en-tête IOS)
+_HOSTNAME_SEARCH_LIMIT = 4096
+
+
 def load_config_file(config_file: str) -> str:
     """
     Charge un fichier de configuration de routeur.
@@ -40,8 +62,13 @@ def extract_hostname(config: str) -> str:
     Returns:
         str: Nom d'hôte du routeur.
     """
-    hostname_pattern = re.compile(r'^hostname (\S+)', re.MULTILINE)
-    match = hostname_pattern.search(config)
+    # Recherche bornée aux premiers ~4 Ko : le hostname est dans l'en-tête,
+    # pas besoin de parcourir une config de plusieurs mégaoctets
+    match = HOSTNAME_RE.search(config, 0, _HOSTNAME_SEARCH_LIMIT)
+    if match is None and len(config) > _HOSTNAME_SEARCH_LIMIT:
+        # Repli : config inhabituelle où la directive apparaît plus loin
+        # (ou chevauche la limite), on balaye alors tout le texte
+        match = HOSTNAME_RE.search(config)
     if match:
         return match.group(1)
     return "unknown"
@@ -60,56 +87,85 @@ def parse_config(config: str) -> Dict[str, List[str]]:
     sections = {}
     current_section = "global"
     sections[current_section] = []
-    
-    # Expressions régulières pour identifier les débuts de section
-    interface_pattern = re.compile(r'^interface (\S+)')
-    router_pattern = re.compile(r'^router (\S+) (\S+)')
-    route_map_pattern = re.compile(r'^route-map (\S+)')
-    ipv6_pattern = re.compile(r'^ipv6 router (\S+) (\S+)')
-    acl_pattern = re.compile(r'^ip access-list (\S+) (\S+)')
-    
-    for line in config.split('\n'):
+
+    # StringIO itère ligne à ligne sans matérialiser la liste complète que
+    # produirait split('\n') : pas de copie intégrale d'une grosse config
+    for line in io.StringIO(config):
         line = line.strip()
-        
+
         # Ignorer les lignes vides et les commentaires
         if not line or line.startswith('!'):
             continue
-            
-        # Vérifier si c'est le début d'une nouvelle section
-        interface_match = interface_pattern.match(line)
-        router_match = router_pattern.match(line)
-        route_map_match = route_map_pattern.match(line)
-        ipv6_match = ipv6_pattern.match(line)
-        acl_match = acl_pattern.match(line)
-        
-        if interface_match:
-            current_section = f"interface_{interface_match.group(1)}"
-            sections[current_section] = [line]
-        elif router_match:
-            protocol = router_match.group(1)
-            process_id = router_match.group(2)
-            current_section = f"{protocol}_{process_id}"
-            sections[current_section] = [line]
-        elif ipv6_match:
-            protocol = ipv6_match.group(1)
-            process_id = ipv6_match.group(2)
-            current_section = f"ipv6_{protocol}_{process_id}"
-            sections[current_section] = [line]
-        elif route_map_match:
-            route_map_name = route_map_match.group(1)
-            current_section = f"route_map_{route_map_name}"
-            sections[current_section] = [line]
-        elif acl_match:
-            acl_type = acl_match.group(1)
-            acl_name = acl_match.group(2)
-            current_section = f"acl_{acl_type}_{acl_name}"
+
+        # Internée, une ligne identique d'un routeur à l'autre partage le même
+        # objet : les sets du diff comparent alors des pointeurs
+        line = sys.intern(line)
+
+        # Vérifier si c'est le début d'une nouvelle section : un seul match,
+        # le groupe nommé renseigné indique le type de section
+        match = SECTION_RE.match(line)
+
+        if match:
+            if match.group('iface'):
+                current_section = f"interface_{match.group('iface')}"
+            elif match.group('rproto'):
+                current_section = f"{match.group('rproto')}_{match.group('rpid')}"
+            elif match.group('v6proto'):
+                current_section = f"ipv6_{match.group('v6proto')}_{match.group('v6pid')}"
+            elif match.group('rmap'):
+                current_section = f"route_map_{match.group('rmap')}"
+            else:
+                current_section = f"acl_{match.group('aclt')}_{match.group('acln')}"
             sections[current_section] = [line]
         elif line == "end" or line == "exit":
             current_section = "global"
         else:
             sections[current_section].append(line)
-            
-    return sections
+
+    # Dédupliquer chaque section dès le parsing (dict.fromkeys garde l'ordre) :
+    # les diffs en aval n'ont plus à re-hacher les doublons à chaque comparaison
+    return {name: list(dict.fromkeys(lines)) for name, lines in sections.items()}
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_cached(path: str, mtime_ns: int, size: int) -> Tuple[str, Dict[str, List[str]]]:
+    """
+    Charge et parse un fichier de configuration, mémoïsé par (chemin, mtime, taille).
+
+    La clé inclut mtime et taille : un fichier modifié invalide naturellement
+    son entrée. Comparer N routeurs contre la même référence ne lit et ne
+    parse donc le fichier de référence qu'une seule fois.
+
+    Args:
+        path (str): Chemin vers le fichier de configuration.
+        mtime_ns (int): Date de modification du fichier en nanosecondes.
+        size (int): Taille du fichier en octets.
+
+    Returns:
+        Tuple[str, Dict[str, List[str]]]: Nom d'hôte et sections parsées.
+    """
+    config = load_config_file(path)
+    return extract_hostname(config), parse_config(config)
+
+
+def _load_and_parse(config_file: str) -> Tuple[str, Dict[str, List[str]]]:
+    """
+    Renvoie (hostname, sections parsées) d'un fichier, via le cache si possible.
+
+    Args:
+        config_file (str): Chemin vers le fichier de configuration.
+
+    Returns:
+        Tuple[str, Dict[str, List[str]]]: Nom d'hôte et sections parsées.
+    """
+    try:
+        st = os.stat(config_file)
+    except OSError:
+        # Fichier illisible : load_config_file affichera l'erreur et
+        # renverra une configuration vide, sans polluer le cache
+        config = load_config_file(config_file)
+        return extract_hostname(config), parse_config(config)
+    return _parse_cached(config_file, st.st_mtime_ns, st.st_size)
 
 
 def compare_configs(reference_config: Dict[str, List[str]], new_config: Dict[str, List[str]]) -> Dict[str, Dict[str, List[str]]]:
@@ -128,33 +184,65 @@ def compare_configs(reference_config: Dict[str, List[str]], new_config: Dict[str
         "removed_sections": {},
         "modified_sections": {}
     }
-    
+
+    # Même objet, deux configs vides ou égales : aucun diff possible, on
+    # court-circuite avant de parcourir la moindre section (l'égalité de
+    # dicts se compare en C et s'arrête à la première divergence)
+    if reference_config is new_config or reference_config == new_config:
+        return diff
+
+    # Les vues keys() supportent l'algèbre d'ensembles en C : trois
+    # différences/intersection remplacent trois boucles de tests d'appartenance
+    ref_keys = reference_config.keys()
+    new_keys = new_config.keys()
+
     # Trouver les sections ajoutées
-    for section in new_config:
-        if section not in reference_config:
-            diff["added_sections"][section] = new_config[section]
-    
+    for section in new_keys - ref_keys:
+        diff["added_sections"][section] = new_config[section]
+
     # Trouver les sections supprimées
-    for section in reference_config:
-        if section not in new_config:
-            diff["removed_sections"][section] = reference_config[section]
-    
+    for section in ref_keys - new_keys:
+        diff["removed_sections"][section] = reference_config[section]
+
     # Trouver les sections modifiées
-    for section in reference_config:
-        if section in new_config:
-            ref_lines = set(reference_config[section])
-            new_lines = set(new_config[section])
-            
-            added_lines = new_lines - ref_lines
-            removed_lines = ref_lines - new_lines
-            
-            if added_lines or removed_lines:
-                diff["modified_sections"][section] = {
-                    "added": list(added_lines),
-                    "removed": list(removed_lines)
-                }
-    
-    return diff
+    for section in ref_keys & new_keys:
+        ref_lines = reference_config[section]
+        new_lines = new_config[section]
+
+        # Cas le plus courant : la section n'a pas bougé, l'égalité des
+        # listes court-circuite avant de hacher quoi que ce soit
+        if ref_lines == new_lines:
+            continue
+
+        # Un seul set construit (sur le plus petit côté), le grand côté est
+        # parcouru une fois pour classer chaque ligne ; les doublons du grand
+        # côté sont absorbés par les sets de sortie
+        if len(ref_lines) <= len(new_lines):
+            small, large, flip = set(ref_lines), new_lines, False
+        else:
+            small, large, flip = set(new_lines), ref_lines, True
+        only_large = set()
+        shared = set()
+        for line in large:
+            if line in small:
+                shared.add(line)
+            else:
+                only_large.add(line)
+        only_small = small - shared
+
+        added_lines = only_small if flip else only_large
+        removed_lines = only_large if flip else only_small
+
+        if added_lines or removed_lines:
+            # Stockées triées une fois pour toutes : les rendus texte et HTML
+            # du même diff n'ont plus à re-trier chacun de leur côté
+            diff["modified_sections"][section] = {
+                "added": sorted(added_lines),
+                "removed": sorted(removed_lines)
+            }
+
+    # Sections triées une seule fois ici plutôt qu'à chaque rendu
+    return {name: dict(sorted(sections.items())) for name, sections in diff.items()}
 
 
 def save_config_diff(diff: Dict[str, Dict[str, List[str]]], reference_name: str, new_name: str, output_dir: str = "diffs") -> str:
@@ -170,55 +258,53 @@ def save_config_diff(diff: Dict[str, Dict[str, List[str]]], reference_name: str,
     Returns:
         str: Chemin du fichier de diff créé.
     """
-    # Créer le répertoire de sortie s'il n'existe pas
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    # Créer le répertoire de sortie s'il n'existe pas (un seul appel idempotent)
+    os.makedirs(output_dir, exist_ok=True)
         
     # Créer le chemin du fichier de sortie
     output_file = os.path.join(output_dir, f"{reference_name}_to_{new_name}_diff.txt")
     
-    # Écrire le diff dans le fichier
+    # Construire le rapport en mémoire puis l'écrire en une seule fois
+    parts = [f"# Différences de configuration entre {reference_name} et {new_name}\n\n"]
+
+    # Sections ajoutées : join assemble chaque bloc de lignes en C, sans
+    # f-string par ligne
+    if diff["added_sections"]:
+        parts.append("## Sections ajoutées\n\n")
+        for section, lines in diff["added_sections"].items():
+            parts.append(f"### {section}\n```\n")
+            parts.append("\n".join(lines) + "\n")
+            parts.append("```\n\n")
+
+    # Sections supprimées
+    if diff["removed_sections"]:
+        parts.append("## Sections supprimées\n\n")
+        for section, lines in diff["removed_sections"].items():
+            parts.append(f"### {section}\n```\n")
+            parts.append("\n".join(lines) + "\n")
+            parts.append("```\n\n")
+
+    # Sections modifiées
+    if diff["modified_sections"]:
+        parts.append("## Sections modifiées\n\n")
+        for section, changes in diff["modified_sections"].items():
+            parts.append(f"### {section}\n")
+
+            # Lignes ajoutées
+            if changes.get("added"):
+                parts.append("#### Lignes ajoutées\n```\n")
+                parts.append("\n".join(changes["added"]) + "\n")
+                parts.append("```\n\n")
+
+            # Lignes supprimées
+            if changes.get("removed"):
+                parts.append("#### Lignes supprimées\n```\n")
+                parts.append("\n".join(changes["removed"]) + "\n")
+                parts.append("```\n\n")
+
     with open(output_file, 'w') as f:
-        f.write(f"# Différences de configuration entre {reference_name} et {new_name}\n\n")
-        
-        # Sections ajoutées
-        if diff["added_sections"]:
-            f.write("## Sections ajoutées\n\n")
-            for section, lines in sorted(diff["added_sections"].items()):
-                f.write(f"### {section}\n```\n")
-                for line in lines:
-                    f.write(f"{line}\n")
-                f.write("```\n\n")
-        
-        # Sections supprimées
-        if diff["removed_sections"]:
-            f.write("## Sections supprimées\n\n")
-            for section, lines in sorted(diff["removed_sections"].items()):
-                f.write(f"### {section}\n```\n")
-                for line in lines:
-                    f.write(f"{line}\n")
-                f.write("```\n\n")
-        
-        # Sections modifiées
-        if diff["modified_sections"]:
-            f.write("## Sections modifiées\n\n")
-            for section, changes in sorted(diff["modified_sections"].items()):
-                f.write(f"### {section}\n")
-                
-                # Lignes ajoutées
-                if changes.get("added"):
-                    f.write("#### Lignes ajoutées\n```\n")
-                    for line in sorted(changes["added"]):
-                        f.write(f"{line}\n")
-                    f.write("```\n\n")
-                
-                # Lignes supprimées
-                if changes.get("removed"):
-                    f.write("#### Lignes supprimées\n```\n")
-                    for line in sorted(changes["removed"]):
-                        f.write(f"{line}\n")
-                    f.write("```\n\n")
-        
+        f.write("".join(parts))
+
     print(f"Diff écrit dans {output_file}")
     return output_file
 
@@ -235,18 +321,15 @@ def compare_router_config_files(reference_config_file: str, new_config_file: str
     Returns:
         Dict[str, Dict[str, List[str]]]: Différences entre les configurations.
     """
-    # Charger les configurations
-    reference_config = load_config_file(reference_config_file)
-    new_config = load_config_file(new_config_file)
-    
-    # Extraire les noms des routeurs
-    reference_name = extract_hostname(reference_config) or os.path.basename(reference_config_file).split('_')[0]
-    new_name = extract_hostname(new_config) or os.path.basename(new_config_file).split('_')[0]
-    
-    # Parser les configurations
-    parsed_reference = parse_config(reference_config)
-    parsed_new = parse_config(new_config)
-    
+    # Charger et parser les configurations (mémoïsé : une référence comparée
+    # à N routeurs n'est lue et parsée qu'une fois)
+    reference_name, parsed_reference = _load_and_parse(reference_config_file)
+    new_name, parsed_new = _load_and_parse(new_config_file)
+
+    # Nom de repli si la configuration ne contient pas de hostname
+    reference_name = reference_name or os.path.basename(reference_config_file).split('_')[0]
+    new_name = new_name or os.path.basename(new_config_file).split('_')[0]
+
     # Comparer les configurations
     diff = compare_configs(parsed_reference, parsed_new)
     
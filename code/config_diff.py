@@ -6,6 +6,7 @@ les différences et faciliter l'implémentation de nouveaux protocoles.
 
 import os
 import re
+import sys
 from typing import Dict, List, Tuple, Set
 
 from GNS3 import Connector
@@ -52,9 +53,8 @@ def save_router_config(config: str, router_name: str, output_dir: str = "configs
     Returns:
         str: Chemin du fichier de configuration créé.
     """
-    # Créer le répertoire de sortie s'il n'existe pas
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    # Créer le répertoire de sortie s'il n'existe pas (un seul appel idempotent)
+    os.makedirs(output_dir, exist_ok=True)
         
     # Créer le chemin du fichier de sortie
     output_file = os.path.join(output_dir, f"{router_name}_config.txt")
@@ -91,7 +91,11 @@ def parse_config(config: str) -> Dict[str, List[str]]:
         # Ignorer les lignes vides et les commentaires
         if not line or line.startswith('!'):
             continue
-            
+
+        # Internée, une ligne identique d'un routeur à l'autre partage le même
+        # objet : les sets du diff comparent alors des pointeurs
+        line = sys.intern(line)
+
         # Vérifier si c'est le début d'une nouvelle section
         interface_match = interface_pattern.match(line)
         router_match = router_pattern.match(line)
@@ -147,18 +151,37 @@ def compare_configs(reference_config: Dict[str, List[str]], new_config: Dict[str
     # Trouver les sections modifiées
     for section in reference_config:
         if section in new_config:
-            ref_lines = set(reference_config[section])
-            new_lines = set(new_config[section])
-            
-            added_lines = new_lines - ref_lines
-            removed_lines = ref_lines - new_lines
-            
+            ref_lines = reference_config[section]
+            new_lines = new_config[section]
+
+            # Section inchangée : l'égalité des listes évite tout hachage
+            if ref_lines == new_lines:
+                continue
+
+            # Le set n'est construit que sur le plus petit côté ; le grand
+            # côté est parcouru une fois pour classer chaque ligne
+            if len(ref_lines) <= len(new_lines):
+                small, large, flip = set(ref_lines), new_lines, False
+            else:
+                small, large, flip = set(new_lines), ref_lines, True
+            only_large = set()
+            shared = set()
+            for line in large:
+                if line in small:
+                    shared.add(line)
+                else:
+                    only_large.add(line)
+            only_small = small - shared
+
+            added_lines = only_small if flip else only_large
+            removed_lines = only_large if flip else only_small
+
             if added_lines or removed_lines:
                 diff["modified_sections"][section] = {
                     "added": list(added_lines),
                     "removed": list(removed_lines)
                 }
-    
+
     return diff
 
 
@@ -256,9 +279,8 @@ def compare_networks(reference_network_file: str, new_network_file: str, output_
         new_network_file (str): Chemin vers le fichier d'intention du réseau avec les nouveaux protocoles.
         output_dir (str): Répertoire de sortie pour les fichiers de diff.
     """
-    # Créer le répertoire de sortie s'il n'existe pas
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    # Créer le répertoire de sortie s'il n'existe pas (un seul appel idempotent)
+    os.makedirs(output_dir, exist_ok=True)
     
     # Importer les modules nécessaires ici pour éviter les imports circulaires
     from intent_parser import parse_intent_file
@@ -296,9 +318,9 @@ def compare_networks(reference_network_file: str, new_network_file: str, output_
             # Écrire les commandes ajoutées dans un fichier
             output_file = os.path.join(output_dir, f"{hostname}_diff.txt")
             with open(output_file, 'w') as f:
-                f.write(f"# Commandes ajoutées pour {hostname}\n")
-                for cmd in sorted(added_commands):
-                    f.write(f"{cmd}\n")
+                # Une seule écriture au lieu d'une par commande
+                f.write("".join([f"# Commandes ajoutées pour {hostname}\n"]
+                                + [f"{cmd}\n" for cmd in sorted(added_commands)]))
             
             print(f"Diff pour {hostname} écrit dans {output_file}")
 
@@ -26,9 +26,8 @@ def generate_html_diff(diff: Dict[str, Dict[str, List[str]]], reference_name: st
     Returns:
         str: Chemin du fichier HTML généré.
     """
-    # Créer le répertoire de sortie s'il n'existe pas
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    # Créer le répertoire de sortie s'il n'existe pas (un seul appel idempotent)
+    os.makedirs(output_dir, exist_ok=True)
         
     # Créer le chemin du fichier de sortie
     output_file = os.path.join(output_dir, f"{reference_name}_to_{new_name}_diff.html")
@@ -76,7 +75,7 @@ def generate_html_diff(diff: Dict[str, Dict[str, List[str]]], reference_name: st
         html_content += """
         <h2 class="added">Sections ajoutées</h2>
         """
-        for section, lines in sorted(diff["added_sections"].items()):
+        for section, lines in diff["added_sections"].items():
             html_content += f"""
             <h3>{section}</h3>
             <pre class="added">
@@ -90,7 +89,7 @@ def generate_html_diff(diff: Dict[str, Dict[str, List[str]]], reference_name: st
         html_content += """
         <h2 class="removed">Sections supprimées</h2>
         """
-        for section, lines in sorted(diff["removed_sections"].items()):
+        for section, lines in diff["removed_sections"].items():
             html_content += f"""
             <h3>{section}</h3>
             <pre class="removed">
@@ -104,7 +103,7 @@ def generate_html_diff(diff: Dict[str, Dict[str, List[str]]], reference_name: st
         html_content += """
         <h2 class="modified">Sections modifiées</h2>
         """
-        for section, changes in sorted(diff["modified_sections"].items()):
+        for section, changes in diff["modified_sections"].items():
             html_content += f"""
             <h3>{section}</h3>
             """
@@ -115,7 +114,7 @@ def generate_html_diff(diff: Dict[str, Dict[str, List[str]]], reference_name: st
                 <h4>Lignes ajoutées</h4>
                 <pre class="added">
                 """
-                for line in sorted(changes["added"]):
+                for line in changes["added"]:
                     html_content += f"{line}\n"
                 html_content += "</pre>\n"
             
@@ -125,7 +124,7 @@ def generate_html_diff(diff: Dict[str, Dict[str, List[str]]], reference_name: st
                 <h4>Lignes supprimées</h4>
                 <pre class="removed">
                 """
-                for line in sorted(changes["removed"]):
+                for line in changes["removed"]:
                     html_content += f"{line}\n"
                 html_content += "</pre>\n"
     
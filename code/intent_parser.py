@@ -14,6 +14,7 @@ The module supports:
 
 import ipaddress
 import json
+import sys
 
 from autonomous_system import AS, GlobalRouterIDCounter
 from network import SubNetwork
@@ -104,10 +105,16 @@ def parse_intent_file(file_path: str) -> tuple[list[AS], list[Router]]:
             
             les_as.append(AS(ip, as_number, routers, internal_routing, connected_as, loopback_prefix, global_counter, ip_version, ipv4_prefix, LDP_activation))
 
+        as_by_number = {one_as.AS_number: one_as for one_as in les_as}
+
         les_routers = []
         for router in data[ROUTER_LIST_NAME]:
-            hostname = router["hostname"]
+            # Hostnames are dict keys all over the hot paths downstream;
+            # interning them enables CPython's identity-based dict fast path.
+            hostname = sys.intern(router["hostname"])
             links = router["links"]
+            for link in links:
+                link["hostname"] = sys.intern(link["hostname"])
             as_number = router["AS_number"]
             VPN_family = router.get("VPN_family", None)
             position = router.get("position", {"x": 0, "y": 0})
@@ -124,12 +131,9 @@ def parse_intent_file(file_path: str) -> tuple[list[AS], list[Router]]:
             if ipv4_loopback_address is not None:
                 addr, prefix = ipv4_loopback_address.split('/')
                 new_router.router_id = int(addr.split(".")[-1])
-                for one_as in les_as:
-                    if one_as.AS_number == as_number:
-                        one_as.global_router_counter.reserve_id(new_router.router_id)
-                        new_as = one_as
-                        les_as.pop(les_as.index(one_as))
-                        les_as.append(new_as)
+                one_as = as_by_number.get(as_number)
+                if one_as is not None:
+                    one_as.global_router_counter.reserve_id(new_router.router_id)
 
             les_routers.append(new_router)
 
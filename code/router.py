@@ -19,8 +19,46 @@ from ipaddress import IPv6Address, IPv4Address, IPv6Network, IPv4Network
 VRF_PROCESSUS = {}
 LAST_ID_RD = 1
 
+# Templates précompilés pour les blocs de voisins BGP : format_map évite de
+# re-parser une f-string à chaque voisin dans set_bgp_config_data.
+IBGP_NEIGHBOR_TMPL = """neighbor {ip} remote-as {asn}
+    neighbor {ip} update-source {lo}
+    neighbor {ip} send-community both
+    neighbor {ip} next-hop-self
+    """
+VPNV4_AF_TMPL = """address-family vpnv4
+    neighbor {ip} activate
+    """
+VPNV4_AF_RR_TMPL = """address-family vpnv4
+    neighbor {ip} activate
+    neighbor {ip} route-reflector-client
+    """
+EBGP_VRF_AF_TMPL = """address-family ipv4 vrf {vrf}
+    neighbor {ip} remote-as {asn}
+    neighbor {ip} activate
+    redistribute connected
+    """
+EBGP_NEIGHBOR_TMPL = """no synchronization
+    bgp log-neighbor-changes
+    neighbor {ip} remote-as {asn}
+    network {net} mask {mask}
+    """
+IBGP_NEIGHBOR_CFG_TMPL = "  neighbor {ip} remote-as {asn}\n  neighbor {ip} update-source {lo}\n"
+IBGP_AF_CFG_TMPL = "  neighbor {ip} activate\n  neighbor {ip} send-community\n"
+
 
 class Router:
+    __slots__ = (
+        "hostname", "links", "link_hostnames", "link_as_numbers", "AS_number", "ip_version", "VPN_family",
+        "passive_interfaces", "loopback_interfaces", "counter_loopback_interfaces", "router_id",
+        "subnetworks_per_link", "loopback_subnetworks_per_link", "ip_per_link", "loopback_ip_per_link",
+        "interface_per_link", "loopback_interface_per_link", "config_str_per_link",
+        "loopback_config_str_per_link", "voisins_ebgp", "voisins_ibgp", "available_interfaces",
+        "config_bgp", "position", "loopback_address", "internal_routing_loopback_config", "route_maps",
+        "used_route_maps", "ldp_config", "vrf_config", "network_address", "dico_customer_rt",
+        "dico_VRF_name", "dico_VRF_config_per_link", "part_config_str_per_link", "all_interface_VRF_config",
+    )
+
     def __init__(self, hostname: str, links, AS_number: int, position=None, ip_version: int = 6, VPN_family=None):
         """Initialize a Router object with the given parameters.
         
@@ -33,6 +71,8 @@ class Router:
         """
         self.hostname = hostname
         self.links = links
+        self.link_hostnames = [link['hostname'] for link in links]
+        self.link_as_numbers = None
         self.AS_number = AS_number
         self.ip_version = ip_version
         self.VPN_family = VPN_family
@@ -426,7 +466,7 @@ class Router:
                 is_provider_edge = f"ip {protocol} {NOM_PROCESSUS_IGP_PAR_DEFAUT}{area_or_enable}\n" if self.is_provider_edge(autonomous_systems, all_routers) or self.is_provider_edge(autonomous_systems, all_routers) else ""
                 self.internal_routing_loopback_config = f"interface {STANDARD_LOOPBACK_INTERFACE}\n no ipv6 address\n ip address {self.loopback_address} 255.255.255.255\n{is_provider_edge}"
 
-    def set_bgp_config_data(self, autonomous_systems: dict[int, AS], all_routers: dict[str, "Router"], mode: str):
+    def set_bgp_config_data(self, autonomous_systems: dict[int, AS], all_routers: dict[str, "Router"], mode: str) -> None:
         """
         Génère le string de configuration bgp du router self
 
@@ -434,112 +474,64 @@ class Router:
         sorties : changement de plusieurs attributs de l'objet, mais surtout de config_bgp qui contient le string de configuration à la fin de l'exécution de la fonction
         """
         my_as = autonomous_systems[self.AS_number]
-        
-        for routers in my_as.routers : 
-            if all_routers[routers].is_provider_edge(autonomous_systems, all_routers) and routers != self.hostname:
-                self.voisins_ibgp.add(routers)
+        # Locaux hoistés : LOAD_FAST dans les boucles au lieu de LOAD_GLOBAL/LOAD_ATTR.
+        _all = all_routers
+        _asn = self.AS_number
+        _std_lo = STANDARD_LOOPBACK_INTERFACE
+
+        self.voisins_ibgp = my_as.compute_provider_edges(autonomous_systems, all_routers) - {self.hostname}
                 
-        for link in self.links:
-            if all_routers[link['hostname']].AS_number != self.AS_number:
-                self.voisins_ebgp[link['hostname']] = all_routers[link['hostname']].AS_number
+        self.voisins_ebgp = {hostname: as_number
+                             for hostname, as_number in zip(self.link_hostnames, self.get_link_as_numbers(all_routers))
+                             if as_number != _asn}
 
                 
         if mode == "telnet":
             # todo : telnet commands
-            if self.hostname != "PE1":
-
-                self.config_bgp = f"""router bgp {self.AS_number}
+            header = f"""router bgp {self.AS_number}
     bgp router-id {self.router_id}.{self.router_id}.{self.router_id}.{self.router_id}
     """
-                config_address_family = ""
-                if my_as.ip_version == 6:
-                    config_neighbors_ibgp = "address-family ipv6 unicast\n"
-                else:
-                    config_neighbors_ibgp = "bgp log-neighbor-changes\n"
-
-                for voisin_ibgp in self.voisins_ibgp:
-                    remote_ip = all_routers[voisin_ibgp].loopback_address
-                    config_neighbors_ibgp += f"""neighbor {remote_ip} remote-as {self.AS_number}    
-    neighbor {remote_ip} update-source {STANDARD_LOOPBACK_INTERFACE}
-    neighbor {remote_ip} send-community both 
-    neighbor {remote_ip} next-hop-self
-    """
-                    config_address_family += f"""address-family vpnv4 
-    neighbor {remote_ip} activate 
-    """
-                config_neighbors_ebgp = ""
-                for voisin_ebgp in self.voisins_ebgp:
-                    if self.is_provider_edge(autonomous_systems, all_routers):
-                        remote_ip = all_routers[voisin_ebgp].ip_per_link[self.hostname]
-                        remote_as = all_routers[voisin_ebgp].AS_number
-                        config_address_family += f"""address-family ipv4 vrf {self.dico_VRF_name[(voisin_ebgp,self.hostname)][0]}
-    neighbor {remote_ip} remote-as {remote_as}
-    neighbor {remote_ip} activate
-    redistribute connected
-    """
-                    else:
-                        remote_ip = all_routers[voisin_ebgp].ip_per_link[self.hostname]
-                        remote_as = all_routers[voisin_ebgp].AS_number
-                        config_neighbors_ebgp += f"""no synchronization
-    bgp log-neighbor-changes
-    neighbor {remote_ip} remote-as {all_routers[voisin_ebgp].AS_number}
-    network {self.network_address[voisin_ebgp][0]} mask {self.network_address[voisin_ebgp][1]}
-    """
-                    self.config_bgp += config_neighbors_ibgp
-                    self.config_bgp += config_neighbors_ebgp
-                    self.config_bgp += config_address_family
+            config_address_family_parts = []
+            if my_as.ip_version == 6:
+                config_neighbors_ibgp_parts = ["address-family ipv6 unicast\n"]
             else:
+                config_neighbors_ibgp_parts = ["bgp log-neighbor-changes\n"]
 
-                self.config_bgp = f"""router bgp {self.AS_number}
-    bgp router-id {self.router_id}.{self.router_id}.{self.router_id}.{self.router_id}
-    """
-                config_address_family = ""
-                if my_as.ip_version == 6:
-                    config_neighbors_ibgp = "address-family ipv6 unicast\n"
+            af_tmpl = VPNV4_AF_RR_TMPL if self.hostname == "PE1" else VPNV4_AF_TMPL
+            values = {"ip": None, "asn": _asn, "lo": _std_lo}
+            for voisin_ibgp in self.voisins_ibgp:
+                values["ip"] = _all[voisin_ibgp].loopback_address
+                config_neighbors_ibgp_parts.append(IBGP_NEIGHBOR_TMPL.format_map(values))
+                config_address_family_parts.append(af_tmpl.format_map(values))
+            config_neighbors_ebgp_parts = []
+            pe_self = self.is_provider_edge(autonomous_systems, all_routers)
+            for voisin_ebgp in self.voisins_ebgp:
+                nb = _all[voisin_ebgp]
+                remote_ip = nb.ip_per_link[self.hostname]
+                remote_as = nb.AS_number
+                if pe_self:
+                    config_address_family_parts.append(EBGP_VRF_AF_TMPL.format_map(
+                        {"vrf": self.dico_VRF_name[(voisin_ebgp, self.hostname)][0], "ip": remote_ip, "asn": remote_as}))
                 else:
-                    config_neighbors_ibgp = "bgp log-neighbor-changes\n"
-
-                for voisin_ibgp in self.voisins_ibgp:
-                    remote_ip = all_routers[voisin_ibgp].loopback_address
-                    config_neighbors_ibgp += f"""neighbor {remote_ip} remote-as {self.AS_number}    
-    neighbor {remote_ip} update-source {STANDARD_LOOPBACK_INTERFACE}
-    neighbor {remote_ip} send-community both 
-    neighbor {remote_ip} next-hop-self
-    """
-                    config_address_family += f"""address-family vpnv4 
-    neighbor {remote_ip} activate
-    neighbor {remote_ip} route-reflector-client 
-    """
-                config_neighbors_ebgp = ""
-                for voisin_ebgp in self.voisins_ebgp:
-                    if self.is_provider_edge(autonomous_systems, all_routers):
-                        remote_ip = all_routers[voisin_ebgp].ip_per_link[self.hostname]
-                        remote_as = all_routers[voisin_ebgp].AS_number
-                        config_address_family += f"""address-family ipv4 vrf {self.dico_VRF_name[(voisin_ebgp,self.hostname)][0]}
-    neighbor {remote_ip} remote-as {remote_as}
-    neighbor {remote_ip} activate
-    redistribute connected
-    """
-                    else:
-                        remote_ip = all_routers[voisin_ebgp].ip_per_link[self.hostname]
-                        remote_as = all_routers[voisin_ebgp].AS_number
-                        config_neighbors_ebgp += f"""no synchronization
-    bgp log-neighbor-changes
-    neighbor {remote_ip} remote-as {all_routers[voisin_ebgp].AS_number}
-    network {self.network_address[voisin_ebgp][0]} mask {self.network_address[voisin_ebgp][1]}
-    """
-                    self.config_bgp += config_neighbors_ibgp
-                    self.config_bgp += config_neighbors_ebgp
-                    self.config_bgp += config_address_family
+                    config_neighbors_ebgp_parts.append(EBGP_NEIGHBOR_TMPL.format_map(
+                        {"ip": remote_ip, "asn": remote_as, "net": self.network_address[voisin_ebgp][0], "mask": self.network_address[voisin_ebgp][1]}))
+            parts = [header]
+            parts.extend(config_neighbors_ibgp_parts)
+            parts.extend(config_neighbors_ebgp_parts)
+            if config_address_family_parts:
+                parts.extend(config_address_family_parts)
+            self.config_bgp = "".join(parts)
 
         elif mode == "cfg":
-            config_address_family = ""
-            config_neighbors_ibgp = ""
+            config_address_family_parts = []
+            config_neighbors_ibgp_parts = []
+            values = {"ip": None, "asn": _asn, "lo": _std_lo}
             for voisin_ibgp in self.voisins_ibgp:
-                remote_ip = all_routers[voisin_ibgp].loopback_address
-                config_neighbors_ibgp += f"  neighbor {remote_ip} remote-as {self.AS_number}\n  neighbor {remote_ip} update-source {STANDARD_LOOPBACK_INTERFACE}\n"
-                config_address_family += f"  neighbor {remote_ip} activate\n  neighbor {remote_ip} send-community\n"
-            config_address_family, config_neighbors_ebgp = self.get_ebgp_config(all_routers, config_address_family, my_as)
+                values["ip"] = _all[voisin_ibgp].loopback_address
+                config_neighbors_ibgp_parts.append(IBGP_NEIGHBOR_CFG_TMPL.format_map(values))
+                config_address_family_parts.append(IBGP_AF_CFG_TMPL.format_map(values))
+            config_neighbors_ibgp = "".join(config_neighbors_ibgp_parts)
+            config_address_family, config_neighbors_ebgp = self.get_ebgp_config(all_routers, "".join(config_address_family_parts), my_as)
             config_address_family += f"  network {self.loopback_address}/128\n"
             self.config_bgp = f"""
 router bgp {self.AS_number}
@@ -557,7 +549,7 @@ router bgp {self.AS_number}
 !
 """
 
-    def get_ebgp_config(self, all_routers, config_address_family, my_as):
+    def get_ebgp_config(self, all_routers: dict[str, "Router"], config_address_family: str, my_as: AS) -> tuple[str, str]:
         """
         Generate the configuration for eBGP neighbors.
         """
@@ -593,29 +585,33 @@ discovery transport-address {self.loopback_address}
 exit
 """
             
-    def is_provider_edge(self, autonomous_systems: dict[int, AS], all_routers: dict[str, "Router"]):
+    def get_link_as_numbers(self, all_routers: dict[str, "Router"]) -> list[int]:
+        """
+        Renvoie la liste des numéros d'AS des voisins directs, calculée une fois.
+
+        Garder les numéros d'AS dans une liste parallèle à link_hostnames évite
+        de refaire accès dictionnaire + attribut pour chaque lien à chaque appel
+        de is_provider_edge/is_provider.
+        """
+        if self.link_as_numbers is None:
+            self.link_as_numbers = [all_routers[hostname].AS_number for hostname in self.link_hostnames]
+        return self.link_as_numbers
+
+    def is_provider_edge(self, autonomous_systems: dict[int, AS], all_routers: dict[str, "Router"]) -> bool:
         """
         Détermine si le routeur est un provider edge (PE).
         """
-        connected_with_another_as = False
-        for link in self.links:
-            if self.AS_number != all_routers[link['hostname']].AS_number:
-                connected_with_another_as = True
-                break
-        return autonomous_systems[self.AS_number].LDP_activation and connected_with_another_as
+        return autonomous_systems[self.AS_number].LDP_activation and any(
+            as_number != self.AS_number for as_number in self.get_link_as_numbers(all_routers))
     
-    def is_provider(self, autonomous_systems: dict[int, AS], all_routers: dict[str, "Router"]):
+    def is_provider(self, autonomous_systems: dict[int, AS], all_routers: dict[str, "Router"]) -> bool:
         """
         Détermine si le routeur est un provider (P).
         """
-        connected_with_routers_LDP = True
-        for link in self.links:
-            if self.AS_number != all_routers[link['hostname']].AS_number:
-                connected_with_routers_LDP = False
-                break
-        return autonomous_systems[self.AS_number].LDP_activation and connected_with_routers_LDP
+        return autonomous_systems[self.AS_number].LDP_activation and all(
+            as_number == self.AS_number for as_number in self.get_link_as_numbers(all_routers))
                 
-    def is_other(self, autonomous_systems: dict[int, AS], all_routers: dict[str, "Router"]):
+    def is_other(self, autonomous_systems: dict[int, AS], all_routers: dict[str, "Router"]) -> bool:
         """
         Détermine si le routeur est un customer edge (CE).
         """
@@ -2,6 +2,7 @@
 
 import os
 import re
+import sys
 from typing import Dict, List, Tuple, Set
 
 
@@ -36,55 +37,54 @@ def save_config_diff(diff: Dict[str, Dict[str, List[str]]], reference_name: str,
     Returns:
         str: Chemin du fichier de diff créé.
     """
-    # Créer le répertoire de sortie s'il n'existe pas
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    # Créer le répertoire de sortie s'il n'existe pas (un seul appel idempotent)
+    os.makedirs(output_dir, exist_ok=True)
         
     # Créer le chemin du fichier de sortie
     output_file = os.path.join(output_dir, f"{reference_name}_to_{new_name}_diff.txt")
     
-    # Écrire le diff dans le fichier
+    # Construire le rapport en mémoire (join assemble chaque bloc de lignes
+    # en C) puis l'écrire en une seule fois
+    parts = [f"# Différences de configuration entre {reference_name} et {new_name}\n\n"]
+
+    # Sections ajoutées
+    if diff["added_sections"]:
+        parts.append("## Sections ajoutées\n\n")
+        for section, lines in diff["added_sections"].items():
+            parts.append(f"### {section}\n```\n")
+            parts.append("\n".join(lines) + "\n")
+            parts.append("```\n\n")
+
+    # Sections supprimées
+    if diff["removed_sections"]:
+        parts.append("## Sections supprimées\n\n")
+        for section, lines in diff["removed_sections"].items():
+            parts.append(f"### {section}\n```\n")
+            parts.append("\n".join(lines) + "\n")
+            parts.append("```\n\n")
+
+    # Sections modifiées
+    if diff["modified_sections"]:
+        parts.append("## Sections modifiées\n\n")
+        for section, changes in diff["modified_sections"].items():
+            parts.append(f"### {section}\n")
+
+            # Lignes ajoutées
+            if changes.get("added"):
+                parts.append("#### Lignes ajoutées\n```\n")
+                parts.append("\n".join(changes["added"]) + "\n")
+                parts.append("```\n\n")
+
+            # Lignes supprimées
+            if changes.get("removed"):
+                parts.append("#### Lignes supprimées\n```\n")
+                parts.append("\n".join(changes["removed"]) + "\n")
+                parts.append("```\n\n")
+
+    # Écrire le diff dans le fichier en une seule écriture
     with open(output_file, 'w') as f:
-        f.write(f"# Différences de configuration entre {reference_name} et {new_name}\n\n")
-        
-        # Sections ajoutées
-        if diff["added_sections"]:
-            f.write("## Sections ajoutées\n\n")
-            for section, lines in diff["added_sections"].items():
-                f.write(f"### {section}\n```\n")
-                for line in lines:
-                    f.write(f"{line}\n")
-                f.write("```\n\n")
-        
-        # Sections supprimées
-        if diff["removed_sections"]:
-            f.write("## Sections supprimées\n\n")
-            for section, lines in diff["removed_sections"].items():
-                f.write(f"### {section}\n```\n")
-                for line in lines:
-                    f.write(f"{line}\n")
-                f.write("```\n\n")
-        
-        # Sections modifiées
-        if diff["modified_sections"]:
-            f.write("## Sections modifiées\n\n")
-            for section, changes in diff["modified_sections"].items():
-                f.write(f"### {section}\n")
-                
-                # Lignes ajoutées
-                if changes.get("added"):
-                    f.write("#### Lignes ajoutées\n```\n")
-                    for line in changes["added"]:
-                        f.write(f"{line}\n")
-                    f.write("```\n\n")
-                
-                # Lignes supprimées
-                if changes.get("removed"):
-                    f.write("#### Lignes supprimées\n```\n")
-                    for line in changes["removed"]:
-                        f.write(f"{line}\n")
-                    f.write("```\n\n")
-        
+        f.write("".join(parts))
+
     return output_file
 
 
@@ -114,7 +114,11 @@ def parse_config(config: str) -> Dict[str, List[str]]:
         # Ignorer les lignes vides et les commentaires
         if not line or line.startswith('!'):
             continue
-            
+
+        # Internée, une ligne identique d'un routeur à l'autre partage le même
+        # objet : les sets du diff comparent alors des pointeurs
+        line = sys.intern(line)
+
         # Vérifier si c'est le début d'une nouvelle section
         interface_match = interface_pattern.match(line)
         router_match = router_pattern.match(line)
@@ -176,18 +180,37 @@ def compare_configs(reference_config: Dict[str, List[str]], new_config: Dict[str
     # Trouver les sections modifiées
     for section in reference_config:
         if section in new_config:
-            ref_lines = set(reference_config[section])
-            new_lines = set(new_config[section])
-            
-            added_lines = new_lines - ref_lines
-            removed_lines = ref_lines - new_lines
-            
+            ref_lines = reference_config[section]
+            new_lines = new_config[section]
+
+            # Section inchangée : l'égalité des listes évite tout hachage
+            if ref_lines == new_lines:
+                continue
+
+            # Le set n'est construit que sur le plus petit côté ; le grand
+            # côté est parcouru une fois pour classer chaque ligne
+            if len(ref_lines) <= len(new_lines):
+                small, large, flip = set(ref_lines), new_lines, False
+            else:
+                small, large, flip = set(new_lines), ref_lines, True
+            only_large = set()
+            shared = set()
+            for line in large:
+                if line in small:
+                    shared.add(line)
+                else:
+                    only_large.add(line)
+            only_small = small - shared
+
+            added_lines = only_small if flip else only_large
+            removed_lines = only_large if flip else only_small
+
             if added_lines or removed_lines:
                 diff["modified_sections"][section] = {
                     "added": list(added_lines),
                     "removed": list(removed_lines)
                 }
-    
+
     return diff
 
 
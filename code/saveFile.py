@@ -10,7 +10,9 @@ def write_string_to_file(file_path, data):
     Raises IOError if the file cannot be written.
     """
     try:
-        with open(file_path, 'w') as file:
-            file.write(data)
+        # Router configs are ASCII; encoding once and writing in binary mode
+        # skips the text-layer newline translation and incremental encoder.
+        with open(file_path, 'wb') as file:
+            file.write(data if isinstance(data, bytes) else data.encode('ascii', 'replace'))
     except IOError as e:
         print(f"An error occurred while writing to the file: {e}")
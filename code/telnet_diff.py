@@ -73,9 +73,8 @@ def generate_diff_from_intent_files(reference_file: str, new_file: str, output_d
     Returns:
         Dict[str, Dict[str, List[str]]]: Dictionnaire des commandes ajoutées et supprimées par hostname.
     """
-    # Créer le répertoire de sortie s'il n'existe pas
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    # Créer le répertoire de sortie s'il n'existe pas (un seul appel idempotent)
+    os.makedirs(output_dir, exist_ok=True)
     
     # Charger les réseaux
     reference_as, reference_routers = parse_intent_file(reference_file)
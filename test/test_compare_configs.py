@@ -0,0 +1,37 @@
+import unittest
+from compare_router_configs import compare_configs
+
+class TestCompareConfigs(unittest.TestCase):
+    def test_identical_configs(self):
+        # Aucune différence attendue entre deux configurations identiques
+        config = {"global": ["hostname R1"], "interface_Gi1/0": ["interface Gi1/0", "ip address 10.0.0.1 255.255.255.0"]}
+        diff = compare_configs(config, dict(config))
+        self.assertEqual(diff["added_sections"], {})
+        self.assertEqual(diff["removed_sections"], {})
+        self.assertEqual(diff["modified_sections"], {})
+
+    def test_added_and_removed_sections(self):
+        reference = {"global": ["hostname R1"], "ospf_1": ["router ospf 1"]}
+        new = {"global": ["hostname R1"], "bgp_65000": ["router bgp 65000"]}
+        diff = compare_configs(reference, new)
+        self.assertEqual(diff["added_sections"], {"bgp_65000": ["router bgp 65000"]})
+        self.assertEqual(diff["removed_sections"], {"ospf_1": ["router ospf 1"]})
+        self.assertEqual(diff["modified_sections"], {})
+
+    def test_modified_section(self):
+        reference = {"interface_Gi1/0": ["interface Gi1/0", "ip address 10.0.0.1 255.255.255.0"]}
+        new = {"interface_Gi1/0": ["interface Gi1/0", "ip address 10.0.0.2 255.255.255.0", "no shutdown"]}
+        diff = compare_configs(reference, new)
+        changes = diff["modified_sections"]["interface_Gi1/0"]
+        self.assertEqual(sorted(changes["added"]), ["ip address 10.0.0.2 255.255.255.0", "no shutdown"])
+        self.assertEqual(changes["removed"], ["ip address 10.0.0.1 255.255.255.0"])
+
+    def test_duplicate_lines_are_not_differences(self):
+        # Une ligne dupliquée d'un seul côté ne doit pas apparaître dans le diff
+        reference = {"global": ["hostname R1"]}
+        new = {"global": ["hostname R1", "hostname R1"]}
+        diff = compare_configs(reference, new)
+        self.assertEqual(diff["modified_sections"], {})
+
+if __name__ == "__main__":
+    unittest.main()
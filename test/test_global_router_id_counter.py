@@ -0,0 +1,41 @@
+import unittest
+from autonomous_system import GlobalRouterIDCounter
+
+class TestGlobalRouterIDCounter(unittest.TestCase):
+    def test_sequential_ids(self):
+        # Sans réservation, les identifiants sont simplement consécutifs
+        counter = GlobalRouterIDCounter()
+        self.assertEqual(counter.get_next_router_id(), 1)
+        self.assertEqual(counter.get_next_router_id(), 2)
+        self.assertEqual(counter.get_next_router_id(), 3)
+
+    def test_skips_reserved_block(self):
+        # Un bloc d'identifiants réservés doit être sauté en entier,
+        # quel que soit l'ordre des réservations
+        counter = GlobalRouterIDCounter()
+        counter.reserve_id(4)
+        counter.reserve_id(2)
+        counter.reserve_id(3)
+
+        self.assertEqual(counter.get_next_router_id(), 1)
+        self.assertEqual(counter.get_next_router_id(), 5)
+        self.assertEqual(counter.get_next_router_id(), 6)
+
+    def test_never_returns_a_reserved_id(self):
+        # Un identifiant réservé avant la toute première allocation
+        # ne doit jamais être distribué
+        counter = GlobalRouterIDCounter()
+        counter.reserve_id(1)
+        counter.reserve_id(2)
+
+        self.assertEqual(counter.get_next_router_id(), 3)
+        self.assertEqual(counter.get_next_router_id(), 4)
+
+    def test_reserve_same_id_twice(self):
+        # Réserver deux fois le même identifiant ne change rien
+        counter = GlobalRouterIDCounter()
+        counter.reserve_id(2)
+        counter.reserve_id(2)
+
+        self.assertEqual(counter.get_next_router_id(), 1)
+        self.assertEqual(counter.get_next_router_id(), 3)